@@ -6,23 +6,198 @@ Este exemplo demonstra como usar a API de análise de IA para cruzar dados
 entre perfis DISC e indicadores de saúde mental, gerando insights personalizados.
 """
 
-import requests
+import asyncio
+import io
+import sys
+import time
+import httpx
+import orjson
 import json
+from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
 import os
 
 # Configuração da API
 BASE_URL = "http://localhost:5000"
 API_BASE = f"{BASE_URL}/api/v1"
 
+DISC_STYLES = ("D", "I", "S", "C")
+
+
+@dataclass(slots=True, frozen=True)
+class DiscResult:
+    """Resultado de uma avaliação DISC (scores na ordem D, I, S, C)"""
+    primary_style: str
+    scores: tuple[int, int, int, int]
+    secondary_style: str | None = None
+    intensity: str | None = None
+    flexibility_score: int | None = None
+    
+    def to_payload(self) -> dict:
+        """Serializar no formato esperado pela API (campos opcionais ausentes são omitidos)"""
+        payload = {
+            "primary_style": self.primary_style,
+            "scores": dict(zip(DISC_STYLES, self.scores))
+        }
+        for key in ("secondary_style", "intensity", "flexibility_score"):
+            value = getattr(self, key)
+            if value is not None:
+                payload[key] = value
+        return payload
+
+
+@dataclass(slots=True, frozen=True)
+class MentalHealthResult:
+    """Resultados de saúde mental (PHQ-9, GAD-7, Burnout)"""
+    phq9_score: int
+    gad7_score: int
+    burnout_score: int
+    stress_level: str | None = None
+    sleep_quality: str | None = None
+    
+    def to_payload(self) -> dict:
+        """Serializar no formato esperado pela API (campos opcionais ausentes são omitidos)"""
+        payload = {
+            "phq9_score": self.phq9_score,
+            "gad7_score": self.gad7_score,
+            "burnout_score": self.burnout_score
+        }
+        if self.stress_level is not None:
+            payload["stress_level"] = self.stress_level
+        if self.sleep_quality is not None:
+            payload["sleep_quality"] = self.sleep_quality
+        return payload
+
+
+# Payloads de exemplo (somente leitura, construídos uma vez na importação)
+
+# Perfil D com indicadores de burnout
+_DEFAULT_DISC_CEO = DiscResult(
+    primary_style="D",
+    secondary_style="C",
+    scores=(
+        85,  # D: Muito alto
+        25,  # I: Baixo
+        15,  # S: Muito baixo
+        70   # C: Alto
+    ),
+    intensity="high",
+    flexibility_score=35  # Baixa flexibilidade
+)
+
+_DEFAULT_MH_CEO = MentalHealthResult(
+    phq9_score=12,      # Depressão moderada
+    gad7_score=15,      # Ansiedade moderada-severa
+    burnout_score=75,   # Burnout alto
+    stress_level="high",
+    sleep_quality="poor"
+)
+
+_DEFAULT_CONTEXT_CEO = MappingProxyType({
+    "role": "CEO",
+    "company_size": "startup",
+    "work_hours_per_week": 70,
+    "team_size": 15,
+    "recent_changes": ("funding_round", "rapid_growth", "new_hires")
+})
+
+# Perfil C com ansiedade severa
+_RISK_DISC_C = DiscResult(primary_style="C", scores=(30, 20, 25, 90))
+
+_RISK_MH_C = MentalHealthResult(
+    phq9_score=16,    # Depressão moderada-severa
+    gad7_score=18,    # Ansiedade severa
+    burnout_score=60  # Burnout moderado-alto
+)
+
+
+# Último health-check bem-sucedido (evita repetir a sonda em execuções próximas de main())
+_HEALTH_CACHE = {"ok": False, "ts": 0.0}
+
+
+async def _api_is_up(client: "AsyncMindBridgeAIClient", ttl: float = 30.0) -> bool:
+    """
+    Verificar se a API está acessível pelo pool do cliente
+    
+    Apenas uma resposta positiva é reaproveitada por ttl segundos: depois de uma
+    falha a sonda é repetida, para detectar a API assim que ela voltar.
+    """
+    now = time.monotonic()
+    if _HEALTH_CACHE["ok"] and now - _HEALTH_CACHE["ts"] < ttl:
+        return True
+    
+    response = await client._client.get(f"{BASE_URL}/api/health", timeout=5)
+    _HEALTH_CACHE["ok"] = response.status_code == 200
+    _HEALTH_CACHE["ts"] = now
+    return _HEALTH_CACHE["ok"]
+
+
+# Formato de cada recomendação listada em exemplo_analise_completa
+_REC_FMT = "{i}. {title} ({priority} prioridade)\n   {description}"
+
+# Campos de estatísticas efetivamente usados por exemplo_estatisticas
+_STATS_FIELDS = (
+    "total_analyses",
+    "professional_oversight_percentage",
+    "average_confidence_score",
+    "disc_profile_distribution"
+)
+
+
+def _as_json(value):
+    """Converter resultados e payloads somente leitura em estruturas serializáveis em JSON"""
+    if isinstance(value, (DiscResult, MentalHealthResult)):
+        return value.to_payload()
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _as_json(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
 class MindBridgeAIClient:
     """Cliente para interagir com a API de análise de IA do Mind-Bridge"""
     
     def __init__(self, base_url: str = API_BASE):
+        # requests só é carregado quando o cliente síncrono é de fato usado
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+        
         self.base_url = base_url
         self.session = requests.Session()
-    
-    def analyze_correlation(self, user_id: int, disc_results: dict, mental_health_results: dict, user_context: dict = None):
+        
+        # Pool de conexões keep-alive reutilizado por todas as chamadas à API
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=["GET", "POST"]
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+            "User-Agent": "MindBridgeAIClient/1.0"
+        })
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """Fechar o pool de conexões"""
+        self.session.close()
+    
+    def analyze_correlation(self, user_id: int, disc_results: dict | DiscResult, mental_health_results: dict | MentalHealthResult, user_context: dict = None):
         """
         Executar análise completa de correlação DISC x Saúde Mental
         
@@ -39,13 +214,31 @@ class MindBridgeAIClient:
         
         payload = {
             "user_id": user_id,
-            "disc_results": disc_results,
-            "mental_health_results": mental_health_results,
-            "user_context": user_context or {}
+            "disc_results": _as_json(disc_results),
+            "mental_health_results": _as_json(mental_health_results),
+            "user_context": _as_json(user_context or {})
         }
         
-        response = self.session.post(endpoint, json=payload)
-        return response.json()
+        response = self.session.post(endpoint, data=orjson.dumps(payload))
+        return orjson.loads(response.content)
+    
+    def bulk_analyze_correlation(self, cases: list[dict]):
+        """
+        Executar a análise de correlação para vários usuários em uma única requisição
+        
+        Args:
+            cases: Lista de payloads no mesmo formato de analyze_correlation
+                (user_id, disc_results, mental_health_results, user_context)
+        
+        Returns:
+            dict: Resultados na mesma ordem dos casos enviados
+        """
+        endpoint = f"{self.base_url}/ai-analysis/correlate/bulk"
+        
+        payload = {"cases": [_as_json(case) for case in cases]}
+        
+        response = self.session.post(endpoint, data=orjson.dumps(payload))
+        return orjson.loads(response.content)
     
     def quick_insight(self, disc_style: str, mental_health_scores: dict):
         """
@@ -65,10 +258,10 @@ class MindBridgeAIClient:
             "mental_health_scores": mental_health_scores
         }
         
-        response = self.session.post(endpoint, json=payload)
-        return response.json()
+        response = self.session.post(endpoint, data=orjson.dumps(payload))
+        return orjson.loads(response.content)
     
-    def risk_assessment(self, disc_results: dict, mental_health_results: dict):
+    def risk_assessment(self, disc_results: dict | DiscResult, mental_health_results: dict | MentalHealthResult):
         """
         Calcular avaliação de risco
         
@@ -82,110 +275,164 @@ class MindBridgeAIClient:
         endpoint = f"{self.base_url}/ai-analysis/risk-assessment"
         
         payload = {
-            "disc_results": disc_results,
-            "mental_health_results": mental_health_results
+            "disc_results": _as_json(disc_results),
+            "mental_health_results": _as_json(mental_health_results)
         }
         
-        response = self.session.post(endpoint, json=payload)
-        return response.json()
+        response = self.session.post(endpoint, data=orjson.dumps(payload))
+        return orjson.loads(response.content)
     
     def get_analysis_history(self, user_id: int):
         """Obter histórico de análises de um usuário"""
         endpoint = f"{self.base_url}/ai-analysis/history/{user_id}"
         response = self.session.get(endpoint)
-        return response.json()
+        return orjson.loads(response.content)
     
-    def get_statistics(self):
-        """Obter estatísticas gerais das análises"""
+    def get_statistics(self, fields: list[str] | None = None):
+        """
+        Obter estatísticas gerais das análises
+        
+        Args:
+            fields: Campos de topo desejados (projeção via ?fields=)
+        
+        Returns:
+            dict: Estatísticas (apenas os campos pedidos, quando suportado pela API)
+        """
         endpoint = f"{self.base_url}/ai-analysis/statistics"
-        response = self.session.get(endpoint)
-        return response.json()
+        params = {"fields": ",".join(fields)} if fields else None
+        
+        response = self.session.get(endpoint, params=params)
+        return orjson.loads(response.content)
+
+
+class AsyncMindBridgeAIClient:
+    """Cliente assíncrono (httpx + HTTP/2) para executar chamadas independentes em paralelo"""
+    
+    def __init__(self, base_url: str = API_BASE):
+        self.base_url = base_url
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=True,
+            timeout=10.0,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=20)
+        )
+    
+    async def analyze_correlation(self, user_id: int, disc_results: dict | DiscResult, mental_health_results: dict | MentalHealthResult, user_context: dict = None):
+        """Executar análise completa de correlação DISC x Saúde Mental"""
+        payload = {
+            "user_id": user_id,
+            "disc_results": _as_json(disc_results),
+            "mental_health_results": _as_json(mental_health_results),
+            "user_context": _as_json(user_context or {})
+        }
+        
+        response = await self._client.post("/ai-analysis/correlate", content=orjson.dumps(payload))
+        return orjson.loads(response.content)
+    
+    async def bulk_analyze_correlation(self, cases: list[dict]):
+        """Executar a análise de correlação para vários usuários em uma única requisição"""
+        payload = {"cases": [_as_json(case) for case in cases]}
+        
+        response = await self._client.post("/ai-analysis/correlate/bulk", content=orjson.dumps(payload))
+        return orjson.loads(response.content)
+    
+    async def quick_insight(self, disc_style: str, mental_health_scores: dict):
+        """Gerar insight rápido baseado em dados básicos"""
+        payload = {
+            "disc_style": disc_style,
+            "mental_health_scores": mental_health_scores
+        }
+        
+        response = await self._client.post("/ai-analysis/quick-insight", content=orjson.dumps(payload))
+        return orjson.loads(response.content)
+    
+    async def risk_assessment(self, disc_results: dict | DiscResult, mental_health_results: dict | MentalHealthResult):
+        """Calcular avaliação de risco"""
+        payload = {
+            "disc_results": _as_json(disc_results),
+            "mental_health_results": _as_json(mental_health_results)
+        }
+        
+        response = await self._client.post("/ai-analysis/risk-assessment", content=orjson.dumps(payload))
+        return orjson.loads(response.content)
+    
+    async def get_analysis_history(self, user_id: int):
+        """Obter histórico de análises de um usuário"""
+        response = await self._client.get(f"/ai-analysis/history/{user_id}")
+        return orjson.loads(response.content)
+    
+    async def get_statistics(self, fields: list[str] | None = None):
+        """Obter estatísticas gerais das análises (projeção opcional via ?fields=)"""
+        params = {"fields": ",".join(fields)} if fields else None
+        response = await self._client.get("/ai-analysis/statistics", params=params)
+        return orjson.loads(response.content)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Fechar o pool de conexões"""
+        await self._client.aclose()
 
 
-def exemplo_analise_completa():
+async def exemplo_analise_completa(client: AsyncMindBridgeAIClient):
     """Exemplo de análise completa de correlação"""
     
-    print("🧠 EXEMPLO: Análise Completa de Correlação DISC x Saúde Mental")
-    print("=" * 70)
-    
-    # Inicializar cliente
-    client = MindBridgeAIClient()
-    
-    # Dados de exemplo - Perfil D com indicadores de burnout
-    disc_results = {
-        "primary_style": "D",
-        "secondary_style": "C",
-        "scores": {
-            "D": 85,  # Muito alto
-            "I": 25,  # Baixo
-            "S": 15,  # Muito baixo
-            "C": 70   # Alto
-        },
-        "intensity": "high",
-        "flexibility_score": 35  # Baixa flexibilidade
-    }
-    
-    mental_health_results = {
-        "phq9_score": 12,      # Depressão moderada
-        "gad7_score": 15,      # Ansiedade moderada-severa
-        "burnout_score": 75,   # Burnout alto
-        "stress_level": "high",
-        "sleep_quality": "poor"
-    }
-    
-    user_context = {
-        "role": "CEO",
-        "company_size": "startup",
-        "work_hours_per_week": 70,
-        "team_size": 15,
-        "recent_changes": ["funding_round", "rapid_growth", "new_hires"]
-    }
+    out = io.StringIO()
     
     # Executar análise
-    print("📊 Executando análise de correlação...")
-    result = client.analyze_correlation(
+    result = await client.analyze_correlation(
         user_id=1,
-        disc_results=disc_results,
-        mental_health_results=mental_health_results,
-        user_context=user_context
+        disc_results=_DEFAULT_DISC_CEO,
+        mental_health_results=_DEFAULT_MH_CEO,
+        user_context=_DEFAULT_CONTEXT_CEO
     )
     
+    print("🧠 EXEMPLO: Análise Completa de Correlação DISC x Saúde Mental", file=out)
+    print("=" * 70, file=out)
+    print("📊 Executando análise de correlação...", file=out)
+    
     if result.get('success'):
         analysis = result['result']
         
-        print(f"✅ Análise concluída: {analysis['analysis_id']}")
-        print(f"🎯 Perfil DISC: {analysis['disc_profile']}")
-        print(f"📈 Score de Risco Geral: {analysis['risk_assessment']['overall_risk_score']:.1f}/100")
-        print(f"⚠️  Nível de Risco: {analysis['risk_assessment']['risk_level']}")
-        print(f"👨‍⚕️ Supervisão Profissional: {'Sim' if analysis['professional_oversight_required'] else 'Não'}")
-        print(f"🎯 Confiança da Análise: {analysis['confidence_score']:.1f}/100")
+        print(f"✅ Análise concluída: {analysis['analysis_id']}", file=out)
+        print(f"🎯 Perfil DISC: {analysis['disc_profile']}", file=out)
+        print(f"📈 Score de Risco Geral: {analysis['risk_assessment']['overall_risk_score']:.1f}/100", file=out)
+        print(f"⚠️  Nível de Risco: {analysis['risk_assessment']['risk_level']}", file=out)
+        print(f"👨‍⚕️ Supervisão Profissional: {'Sim' if analysis['professional_oversight_required'] else 'Não'}", file=out)
+        print(f"🎯 Confiança da Análise: {analysis['confidence_score']:.1f}/100", file=out)
         
-        print("\n🔍 INSIGHTS PRINCIPAIS:")
+        print("\n🔍 INSIGHTS PRINCIPAIS:", file=out)
         correlation = analysis['correlation_analysis']
         if isinstance(correlation, dict):
-            print(f"• {correlation.get('correlation_summary', 'Análise detalhada disponível')}")
+            print(f"• {correlation.get('correlation_summary', 'Análise detalhada disponível')}", file=out)
         
-        print("\n💡 RECOMENDAÇÕES PERSONALIZADAS:")
-        for i, rec in enumerate(analysis['personalized_recommendations'][:3], 1):
-            print(f"{i}. {rec['title']} ({rec['priority']} prioridade)")
-            print(f"   {rec['description']}")
+        print("\n💡 RECOMENDAÇÕES PERSONALIZADAS:", file=out)
+        recommendations = analysis['personalized_recommendations'][:3]
+        if recommendations:
+            print("\n".join(
+                _REC_FMT.format(i=i, **rec) for i, rec in enumerate(recommendations, 1)
+            ), file=out)
         
-        print(f"\n📅 Próximo acompanhamento: {analysis['follow_up_schedule']['frequency']}")
+        print(f"\n📅 Próximo acompanhamento: {analysis['follow_up_schedule']['frequency']}", file=out)
         
     else:
-        print(f"❌ Erro na análise: {result.get('message', 'Erro desconhecido')}")
+        print(f"❌ Erro na análise: {result.get('message', 'Erro desconhecido')}", file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
-def exemplo_insight_rapido():
+async def exemplo_insight_rapido(client: AsyncMindBridgeAIClient):
     """Exemplo de insight rápido"""
     
-    print("\n⚡ EXEMPLO: Insight Rápido")
-    print("=" * 40)
-    
-    client = MindBridgeAIClient()
+    out = io.StringIO()
     
     # Dados básicos para insight rápido
-    result = client.quick_insight(
+    result = await client.quick_insight(
         disc_style="I",
         mental_health_scores={
             "depression": 8,   # Leve
@@ -194,97 +441,96 @@ def exemplo_insight_rapido():
         }
     )
     
+    print("\n⚡ EXEMPLO: Insight Rápido", file=out)
+    print("=" * 40, file=out)
+    
     if result.get('success'):
         insight = result['insight']
         
-        print(f"🎭 Perfil: {insight['disc_style']}")
-        print(f"⚠️  Nível de Risco: {insight['risk_level']}")
+        print(f"🎭 Perfil: {insight['disc_style']}", file=out)
+        print(f"⚠️  Nível de Risco: {insight['risk_level']}", file=out)
         
-        print("\n🔍 Insights Chave:")
+        print("\n🔍 Insights Chave:", file=out)
         for insight_text in insight['key_insights']:
-            print(f"• {insight_text}")
+            print(f"• {insight_text}", file=out)
         
-        print("\n💡 Recomendações Rápidas:")
+        print("\n💡 Recomendações Rápidas:", file=out)
         for rec in insight['quick_recommendations']:
-            print(f"• {rec}")
+            print(f"• {rec}", file=out)
         
         if insight['professional_consultation_recommended']:
-            print("\n👨‍⚕️ Recomenda-se consulta profissional")
+            print("\n👨‍⚕️ Recomenda-se consulta profissional", file=out)
     
     else:
-        print(f"❌ Erro: {result.get('message', 'Erro desconhecido')}")
+        print(f"❌ Erro: {result.get('message', 'Erro desconhecido')}", file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
-def exemplo_avaliacao_risco():
+async def exemplo_avaliacao_risco(client: AsyncMindBridgeAIClient):
     """Exemplo de avaliação de risco"""
     
-    print("\n🎯 EXEMPLO: Avaliação de Risco Detalhada")
-    print("=" * 50)
-    
-    client = MindBridgeAIClient()
-    
-    # Dados para avaliação de risco
-    disc_results = {
-        "primary_style": "C",
-        "scores": {"D": 30, "I": 20, "S": 25, "C": 90}
-    }
+    out = io.StringIO()
     
-    mental_health_results = {
-        "phq9_score": 16,    # Depressão moderada-severa
-        "gad7_score": 18,    # Ansiedade severa
-        "burnout_score": 60  # Burnout moderado-alto
-    }
+    result = await client.risk_assessment(_RISK_DISC_C, _RISK_MH_C)
     
-    result = client.risk_assessment(disc_results, mental_health_results)
+    print("\n🎯 EXEMPLO: Avaliação de Risco Detalhada", file=out)
+    print("=" * 50, file=out)
     
     if result.get('success'):
         risk = result['risk_assessment']
         
-        print(f"📊 Score Geral de Risco: {risk['overall_risk_score']:.1f}/100")
-        print(f"🏷️  Categoria: {risk['risk_level']}")
+        print(f"📊 Score Geral de Risco: {risk['overall_risk_score']:.1f}/100", file=out)
+        print(f"🏷️  Categoria: {risk['risk_level']}", file=out)
         
-        print("\n📈 Riscos Individuais:")
+        print("\n📈 Riscos Individuais:", file=out)
         for risk_type, score in risk['individual_risks'].items():
-            print(f"• {risk_type.replace('_', ' ').title()}: {score:.1f}/100")
+            print(f"• {risk_type.replace('_', ' ').title()}: {score:.1f}/100", file=out)
         
-        print(f"\n🔬 Algoritmo: v{risk['algorithm_version']}")
-        print(f"📊 Intervalo de Confiança: {risk['confidence_interval']['confidence_level']*100}%")
+        print(f"\n🔬 Algoritmo: v{risk['algorithm_version']}", file=out)
+        print(f"📊 Intervalo de Confiança: {risk['confidence_interval']['confidence_level']*100}%", file=out)
     
     else:
-        print(f"❌ Erro: {result.get('message', 'Erro desconhecido')}")
+        print(f"❌ Erro: {result.get('message', 'Erro desconhecido')}", file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
-def exemplo_estatisticas():
+async def exemplo_estatisticas(client: AsyncMindBridgeAIClient):
     """Exemplo de estatísticas gerais"""
     
-    print("\n📊 EXEMPLO: Estatísticas do Sistema")
-    print("=" * 45)
+    out = io.StringIO()
     
-    client = MindBridgeAIClient()
+    result = await client.get_statistics(fields=list(_STATS_FIELDS))
     
-    result = client.get_statistics()
+    print("\n📊 EXEMPLO: Estatísticas do Sistema", file=out)
+    print("=" * 45, file=out)
     
     if result.get('success'):
         stats = result['statistics']
         
-        print(f"📈 Total de Análises: {stats['total_analyses']}")
-        print(f"👨‍⚕️ Supervisão Profissional: {stats['professional_oversight_percentage']:.1f}%")
-        print(f"🎯 Confiança Média: {stats['average_confidence_score']}/100")
+        print(f"📈 Total de Análises: {stats['total_analyses']}", file=out)
+        print(f"👨‍⚕️ Supervisão Profissional: {stats['professional_oversight_percentage']:.1f}%", file=out)
+        print(f"🎯 Confiança Média: {stats['average_confidence_score']}/100", file=out)
         
-        print("\n🎭 Distribuição por Perfil DISC:")
+        print("\n🎭 Distribuição por Perfil DISC:", file=out)
         for profile, count in stats['disc_profile_distribution'].items():
             percentage = (count / stats['total_analyses'] * 100) if stats['total_analyses'] > 0 else 0
-            print(f"• {profile}: {count} ({percentage:.1f}%)")
+            print(f"• {profile}: {count} ({percentage:.1f}%)", file=out)
     
     else:
-        print(f"❌ Erro: {result.get('message', 'Erro desconhecido')}")
+        print(f"❌ Erro: {result.get('message', 'Erro desconhecido')}", file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def exemplo_casos_uso_reais():
     """Exemplos de casos de uso reais"""
     
-    print("\n🌟 CASOS DE USO REAIS")
-    print("=" * 30)
+    out = io.StringIO()
+    
+    print("\n🌟 CASOS DE USO REAIS", file=out)
+    print("=" * 30, file=out)
     
     casos = [
         {
@@ -318,10 +564,32 @@ def exemplo_casos_uso_reais():
     ]
     
     for i, caso in enumerate(casos, 1):
-        print(f"\n{i}. {caso['titulo']}")
-        print(f"   Contexto: {caso['contexto']}")
-        print(f"   Riscos: {', '.join(caso['riscos'])}")
-        print(f"   Intervenções: {', '.join(caso['intervencoes'])}")
+        print(f"\n{i}. {caso['titulo']}", file=out)
+        print(f"   Contexto: {caso['contexto']}", file=out)
+        print(f"   Riscos: {', '.join(caso['riscos'])}", file=out)
+        print(f"   Intervenções: {', '.join(caso['intervencoes'])}", file=out)
+    
+    sys.stdout.write(out.getvalue())
+
+
+async def _amain() -> bool:
+    """Verificar a API e executar os exemplos em paralelo (as chamadas são independentes)"""
+    
+    # Um único cliente (e pool HTTP/2) para o health-check e todos os exemplos
+    async with AsyncMindBridgeAIClient() as client:
+        if not await _api_is_up(client):
+            print("❌ API não está rodando. Execute 'python src/main.py' primeiro.")
+            return False
+        
+        print("✅ API está rodando e acessível")
+        
+        await asyncio.gather(
+            exemplo_analise_completa(client),
+            exemplo_insight_rapido(client),
+            exemplo_avaliacao_risco(client),
+            exemplo_estatisticas(client)
+        )
+    return True
 
 
 def main():
@@ -333,19 +601,9 @@ def main():
     print("=" * 80)
     
     try:
-        # Verificar se a API está rodando
-        response = requests.get(f"{BASE_URL}/api/health", timeout=5)
-        if response.status_code != 200:
-            print("❌ API não está rodando. Execute 'python src/main.py' primeiro.")
+        # Verificar se a API está rodando e executar os exemplos
+        if not asyncio.run(_amain()):
             return
-        
-        print("✅ API está rodando e acessível")
-        
-        # Executar exemplos
-        exemplo_analise_completa()
-        exemplo_insight_rapido()
-        exemplo_avaliacao_risco()
-        exemplo_estatisticas()
         exemplo_casos_uso_reais()
         
         print("\n" + "=" * 80)
@@ -357,7 +615,7 @@ def main():
         print("   • Conformidade total com GDPR e Lei de IA da UE")
         print("🚀 Pronto para revolucionar o mercado europeu!")
         
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("❌ Não foi possível conectar à API.")
         print("💡 Certifique-se de que a aplicação está rodando em http://localhost:5000")
         print("   Execute: python src/main.py")
@@ -1,10 +1,14 @@
 import os
 import sys
+import time
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+import orjson
 from flask import Flask, send_from_directory, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from sqlalchemy import event, func, select
 from src.models.user import db, User
 from src.models.assessment import DiscAssessment, MentalHealthAssessment, PersonalizedInsight, ComplianceReport
 from src.models.compliance import (
@@ -15,12 +19,37 @@ from src.models.compliance import (
 from src.routes.user import user_bp
 from src.routes.assessment import assessment_bp
 from src.routes.compliance_api import compliance_bp
-from datetime import datetime
+from datetime import datetime, timezone
 
-app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
+# Caminhos resolvidos uma única vez (absolutos: independem do diretório corrente)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_STATIC = os.path.join(_HERE, 'static')
+_DB = os.path.join(_HERE, 'database', 'mindbridge_eu.db')
+
+# Índices das consultas de /api/compliance/status: auditoria mais recente e
+# contagem de profissionais ativos e verificados
+_COMPLIANCE_INDEXES = (
+    db.Index('ix_audit_date_desc', ComplianceAudit.audit_date.desc()),
+    db.Index('ix_prof_active_verified', LicensedProfessional.is_active, LicensedProfessional.verification_status)
+)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialização JSON via orjson (C), mantendo chaves ordenadas e o fallback padrão do Flask"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app = Flask(__name__, static_folder=_STATIC)
 app.config['SECRET_KEY'] = 'mindbridge_eu_compliance_2024'
-app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(os.path.dirname(__file__), "database", "mindbridge_eu.db")}'
+app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{_DB}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.json = OrjsonProvider(app)
 
 # Configurações de segurança GDPR
 app.config['SESSION_COOKIE_SECURE'] = True
@@ -42,48 +71,78 @@ app.register_blueprint(user_bp, url_prefix='/api')
 app.register_blueprint(assessment_bp, url_prefix='/api')
 app.register_blueprint(compliance_bp, url_prefix='/api/v1')
 
+# Assets do build (nome com hash) podem ficar em cache por um ano; o HTML é sempre revalidado
+_IMMUTABLE_SUFFIXES = ('.js', '.css', '.woff2')
+_IMMUTABLE_MAX_AGE = 31536000
+
 @app.route('/')
 def index():
-    return send_from_directory(app.static_folder, 'index.html')
+    response = send_from_directory(_STATIC, 'index.html', max_age=0)
+    response.cache_control.must_revalidate = True
+    return response
 
 @app.route('/<path:filename>')
 def static_files(filename):
-    return send_from_directory(app.static_folder, filename)
+    if filename.endswith(_IMMUTABLE_SUFFIXES):
+        response = send_from_directory(_STATIC, filename, max_age=_IMMUTABLE_MAX_AGE)
+        response.cache_control.immutable = True
+    else:
+        response = send_from_directory(_STATIC, filename, max_age=0)
+        response.cache_control.must_revalidate = True
+    return response
+
+# Flags de conformidade do health check (fixas após a configuração)
+_HEALTH_COMPLIANCE = {
+    'gdpr': app.config.get('GDPR_COMPLIANCE', False),
+    'ai_act': app.config.get('AI_ACT_COMPLIANCE', False),
+    'professional_oversight': app.config.get('PROFESSIONAL_OVERSIGHT_REQUIRED', False)
+}
+
+# Timestamp do health check formatado no máximo uma vez por segundo: [instante, texto]
+_ts_cache = [0.0, ""]
 
 @app.route('/api/health')
 def health_check():
     """Health check endpoint com status de conformidade"""
+    now = time.time()
+    if now - _ts_cache[0] >= 1.0:
+        _ts_cache[1] = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat()
+        _ts_cache[0] = now
+    
     return jsonify({
         'status': 'healthy',
         'version': '2.0.0-eu-compliant',
-        'compliance': {
-            'gdpr': app.config.get('GDPR_COMPLIANCE', False),
-            'ai_act': app.config.get('AI_ACT_COMPLIANCE', False),
-            'professional_oversight': app.config.get('PROFESSIONAL_OVERSIGHT_REQUIRED', False)
-        },
-        'timestamp': datetime.utcnow().isoformat()
+        'compliance': _HEALTH_COMPLIANCE,
+        'timestamp': _ts_cache[1]
     })
 
 @app.route('/api/compliance/status')
 def compliance_status():
     """Status detalhado de conformidade"""
     try:
-        # Verificar status dos componentes de conformidade
-        total_users = User.query.count()
-        users_with_consent = ConsentManagement.query.count()
-        active_professionals = LicensedProfessional.query.filter_by(
-            is_active=True, 
-            verification_status='verified'
-        ).count()
+        # Verificar status dos componentes de conformidade e a auditoria mais recente
+        # em uma única consulta (subconsultas escalares em vez de cinco idas ao banco)
+        latest_audit = select(ComplianceAudit).order_by(ComplianceAudit.audit_date.desc()).limit(1).subquery()
+        (
+            total_users,
+            users_with_consent,
+            active_professionals,
+            last_audit_score,
+            last_audit_date
+        ) = db.session.execute(select(
+            select(func.count(User.id)).scalar_subquery(),
+            select(func.count(ConsentManagement.id)).scalar_subquery(),
+            select(func.count(LicensedProfessional.id)).where(
+                LicensedProfessional.is_active.is_(True),
+                LicensedProfessional.verification_status == 'verified'
+            ).scalar_subquery(),
+            select(latest_audit.c.compliance_score).scalar_subquery(),
+            select(latest_audit.c.audit_date).scalar_subquery()
+        )).one()
         
         # Calcular métricas de conformidade
         consent_rate = (users_with_consent / total_users * 100) if total_users > 0 else 0
         
-        # Verificar auditorias recentes
-        recent_audit = ComplianceAudit.query.order_by(
-            ComplianceAudit.audit_date.desc()
-        ).first()
-        
         return jsonify({
             'compliance_overview': {
                 'gdpr_compliant': True,
@@ -95,8 +154,8 @@ def compliance_status():
                 'total_users': total_users,
                 'consent_rate': round(consent_rate, 2),
                 'active_professionals': active_professionals,
-                'last_audit_score': recent_audit.compliance_score if recent_audit else None,
-                'last_audit_date': recent_audit.audit_date.isoformat() if recent_audit else None
+                'last_audit_score': last_audit_score,
+                'last_audit_date': last_audit_date.isoformat() if last_audit_date else None
             },
             'data_protection': {
                 'encryption_active': True,
@@ -131,21 +190,6 @@ def create_sample_data():
             email='demo@mindbridge.com',
             company='TechCorp Brasil'
         )
-        db.session.add(demo_user)
-        db.session.flush()  # Para obter o ID
-        
-        # Criar consentimento demo
-        demo_consent = ConsentManagement(
-            user_id=demo_user.id,
-            disc_assessment=True,
-            mental_health_screening=True,
-            predictive_analysis=True,
-            professional_supervision=True,
-            consent_version='2.0',
-            lawful_basis='consent',
-            special_category_basis='explicit_consent'
-        )
-        db.session.add(demo_consent)
         
         # Criar profissional licenciado demo
         demo_professional = LicensedProfessional(
@@ -159,9 +203,23 @@ def create_sample_data():
             languages='["pt", "en", "es"]',
             verification_status='verified'
         )
-        db.session.add(demo_professional)
+        
+        # Usuário e profissional em um único flush (para obter os IDs)
+        db.session.add_all([demo_user, demo_professional])
         db.session.flush()
         
+        # Criar consentimento demo
+        demo_consent = ConsentManagement(
+            user_id=demo_user.id,
+            disc_assessment=True,
+            mental_health_screening=True,
+            predictive_analysis=True,
+            professional_supervision=True,
+            consent_version='2.0',
+            lawful_basis='consent',
+            special_category_basis='explicit_consent'
+        )
+        
         # Criar avaliação DISC demo
         demo_disc = DiscAssessment(
             user_id=demo_user.id,
@@ -172,8 +230,6 @@ def create_sample_data():
             primary_style='C',
             secondary_style='D'
         )
-        db.session.add(demo_disc)
-        db.session.flush()
         
         # Criar avaliação de saúde mental demo
         demo_mental_health = MentalHealthAssessment(
@@ -187,7 +243,7 @@ def create_sample_data():
             wellness_score=75
         )
         db.session.add(demo_mental_health)
-        db.session.flush()
+        db.session.flush()  # A supervisão referencia o ID da avaliação
         
         # Criar supervisão profissional demo
         demo_oversight = ProfessionalOversight(
@@ -198,7 +254,6 @@ def create_sample_data():
             intervention_required=False,
             review_status='reviewed'
         )
-        db.session.add(demo_oversight)
         
         # Criar decisão de IA demo
         demo_ai_governance = AIGovernance(
@@ -212,7 +267,6 @@ def create_sample_data():
             risk_assessment='limited',
             bias_check_passed=True
         )
-        db.session.add(demo_ai_governance)
         
         # Criar insights personalizados demo
         insights_data = [
@@ -232,16 +286,10 @@ def create_sample_data():
             }
         ]
         
-        for insight_data in insights_data:
-            insight = PersonalizedInsight(
-                user_id=demo_user.id,
-                category=insight_data['category'],
-                title=insight_data['title'],
-                content=insight_data['content'],
-                priority=insight_data['priority'],
-                is_read=insight_data['is_read']
-            )
-            db.session.add(insight)
+        db.session.bulk_insert_mappings(
+            PersonalizedInsight,
+            [{**insight_data, 'user_id': demo_user.id} for insight_data in insights_data]
+        )
         
         # Criar política de retenção demo
         retention_policies = [
@@ -250,9 +298,7 @@ def create_sample_data():
             {'data_type': 'processing_logs', 'retention_period_days': 365, 'country_code': 'EU'},  # 1 ano
         ]
         
-        for policy_data in retention_policies:
-            policy = DataRetentionPolicy(**policy_data)
-            db.session.add(policy)
+        db.session.bulk_insert_mappings(DataRetentionPolicy, retention_policies)
         
         # Criar auditoria de conformidade demo
         demo_audit = ComplianceAudit(
@@ -265,7 +311,6 @@ def create_sample_data():
             auditor_id='system_audit_v1',
             next_audit_due=datetime.utcnow().replace(month=12, day=31)
         )
-        db.session.add(demo_audit)
         
         # Criar DPIA demo
         demo_dpia = DataProtectionImpactAssessment(
@@ -282,7 +327,16 @@ def create_sample_data():
             approval_date=datetime.utcnow(),
             next_review_date=datetime.utcnow().replace(year=datetime.utcnow().year + 1)
         )
-        db.session.add(demo_dpia)
+        
+        # Objetos sem dependentes: um único INSERT em lote por tabela
+        db.session.bulk_save_objects([
+            demo_consent,
+            demo_disc,
+            demo_oversight,
+            demo_ai_governance,
+            demo_audit,
+            demo_dpia
+        ])
         
         db.session.commit()
         print("✅ Dados de exemplo criados com conformidade total!")
@@ -291,10 +345,24 @@ def create_sample_data():
         db.session.rollback()
         print(f"❌ Erro ao criar dados de exemplo: {e}")
 
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    """WAL: leitores não bloqueiam o escritor e as escritas viram append no log"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 def create_tables():
     """Criar tabelas e dados iniciais"""
     try:
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', _set_sqlite_pragma)
         db.create_all()
+        # create_all só cria índices junto com tabelas novas; em bancos existentes, criar os que faltam
+        for index in _COMPLIANCE_INDEXES:
+            index.create(db.engine, checkfirst=True)
         create_sample_data()
         print("🚀 Mind-Bridge EU Compliant iniciado com sucesso!")
         print("📊 Dashboard: http://localhost:5000")
@@ -302,23 +370,20 @@ def create_tables():
     except Exception as e:
         print(f"❌ Erro na inicialização: {e}")
 
-@app.before_request
-def before_request():
-    """Executar antes da primeira requisição"""
-    if not hasattr(app, '_database_initialized'):
-        create_tables()
-        app._database_initialized = True
+# Inicializar o banco uma única vez, na carga do módulo (com gunicorn --preload,
+# uma vez no processo mestre), em vez de verificar a cada requisição
+with app.app_context():
+    create_tables()
 
 if __name__ == '__main__':
-    with app.app_context():
-        db.create_all()
-        create_sample_data()
-    
     print("🌍 Mind-Bridge European Compliance Edition")
     print("🔒 GDPR Compliant | AI Act Compliant | Professional Oversight")
     print("📊 Dashboard: http://localhost:5000")
     print("🔧 API Health: http://localhost:5000/api/health")
     print("📋 Compliance Status: http://localhost:5000/api/compliance/status")
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Reloader e debugger só em desenvolvimento (FLASK_DEBUG=1). Em produção, usar um
+    # servidor WSGI com o módulo pré-carregado (banco inicializado uma única vez):
+    #   gunicorn --workers $(nproc) --preload --worker-class gthread main:app
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1')
 
@@ -6,69 +6,337 @@ Esta demonstração mostra como o código agregado transforma o Mind-Bridge
 na ÚNICA plataforma mundial com correlações DISC x DSM-5.
 """
 
+import io
 import json
+import sys
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Mapping
+
+import numpy as np
+
+# Ordem fixa das colunas DISC nas estruturas vetorizadas
+DISC_STYLES = ("D", "I", "S", "C")
+
+# Tabelas fixas das demonstrações (construídas uma vez na importação)
+_IMPRESSIVE_CORRELATIONS = (
+    ("Perfil C", "Personalidade Esquizoide", 0.61, "p < 0.01"),
+    ("Perfil C", "Personalidade Evitativa", 0.58, "p < 0.01"),
+    ("Perfil D", "Personalidade Antissocial", 0.43, "p < 0.01"),
+    ("Perfil S", "Personalidade Dependente", 0.41, "p < 0.01")
+)
+
+# (categoria, diferencial, impacto)
+_ADVANTAGES = (
+    ("Científica", "Primeira plataforma com correlações DSM-5 validadas", "Credibilidade clínica absoluta"),
+    ("Técnica", "Algoritmos preditivos baseados em combinações DISC", "Precisão diagnóstica superior"),
+    ("Regulatória", "Conformidade com padrões clínicos internacionais", "Acesso a mercados regulamentados"),
+    ("Comercial", "Justificativa para preços premium", "Margens de lucro superiores"),
+    ("Estratégica", "Barreira de entrada técnica e científica", "Proteção contra concorrência")
+)
+
+# Limiares de score "High" e "Low" usados nas combinações de alto risco
+HIGH_SCORE = 70
+LOW_SCORE = 30
+
+def _freeze(value):
+    """Converter recursivamente dicts de configuração em mapeamentos somente leitura"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+@lru_cache(maxsize=None)
+def _load_risk_kernel():
+    """
+    Compilar o kernel numba do lote float32 na primeira chamada (None sem numba)
+    
+    numba é opcional e caro de importar: só é carregado quando um lote float32
+    precisa dele, e não na importação deste módulo.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba é opcional: sem ele, analyze_batch usa apenas NumPy
+        return None
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _risk_kernel(scores, letter_idx, corr, thresh):
+        """Risco (N, K) em um único laço fundido, paralelo por perfil"""
+        n_users = scores.shape[0]
+        n_disorders = corr.shape[0]
+        out = np.zeros((n_users, n_disorders), dtype=scores.dtype)
+        for u in prange(n_users):
+            for k in range(n_disorders):
+                score = scores[u, letter_idx[k]]
+                if score >= thresh:
+                    out[u, k] = score / 100 * corr[k]
+        return out
+    
+    return _risk_kernel
+
 
 class PersonalityDisorderDemo:
     """Demonstração das correlações com transtornos de personalidade"""
     
-    def __init__(self):
-        # Correlações científicas validadas (do código fornecido)
-        self.research_correlations = {
-            "Dominance_D": {
-                "antisocial_personality": {
-                    "correlation": 0.43,
-                    "significance": "p < 0.01",
-                    "description": "Strong positive correlation with antisocial traits"
-                }
-            },
-            "Influence_I": {
-                "histrionic_personality": {
-                    "correlation": 0.35,
-                    "significance": "p < 0.05",
-                    "description": "Positive correlation with attention-seeking behaviors"
-                }
-            },
-            "Steadiness_S": {
-                "dependent_personality": {
-                    "correlation": 0.41,
-                    "significance": "p < 0.01",
-                    "description": "Strong positive correlation with dependency traits"
-                }
+    # Correlações científicas validadas (do código fornecido), compartilhadas e somente leitura
+    research_correlations: ClassVar[Mapping] = _freeze({
+        "Dominance_D": {
+            "antisocial_personality": {
+                "correlation": 0.43,
+                "significance": "p < 0.01",
+                "description": "Strong positive correlation with antisocial traits"
+            }
+        },
+        "Influence_I": {
+            "histrionic_personality": {
+                "correlation": 0.35,
+                "significance": "p < 0.05",
+                "description": "Positive correlation with attention-seeking behaviors"
+            }
+        },
+        "Steadiness_S": {
+            "dependent_personality": {
+                "correlation": 0.41,
+                "significance": "p < 0.01",
+                "description": "Strong positive correlation with dependency traits"
+            }
+        },
+        "Conscientiousness_C": {
+            "schizoid_personality": {
+                "correlation": 0.61,
+                "significance": "p < 0.01",
+                "description": "Strong correlation with social withdrawal"
             },
-            "Conscientiousness_C": {
-                "schizoid_personality": {
-                    "correlation": 0.61,
-                    "significance": "p < 0.01",
-                    "description": "Strong correlation with social withdrawal"
-                },
-                "avoidant_personality": {
-                    "correlation": 0.58,
-                    "significance": "p < 0.01",
-                    "description": "Strong correlation with avoidant behaviors"
-                }
+            "avoidant_personality": {
+                "correlation": 0.58,
+                "significance": "p < 0.01",
+                "description": "Strong correlation with avoidant behaviors"
             }
         }
+    })
+    
+    # Combinações preditivas de alto risco, compartilhadas e somente leitura
+    # (cada resultado recebe uma cópia em dict, serializável em JSON)
+    high_risk_combinations: ClassVar[tuple] = tuple(_freeze(combo) for combo in (
+        {
+            "profile": "High D + Low S",
+            "risk_score": 0.78,
+            "risk_description": "Aggressive behaviors, relationship conflicts",
+            "intervention": "Anger management, empathy training"
+        },
+        {
+            "profile": "High C + Low I",
+            "risk_score": 0.82,
+            "risk_description": "Social isolation, depression",
+            "intervention": "Social skills training, exposure therapy"
+        }
+    ))
+    
+    @classmethod
+    def _compile_tables(cls):
+        """Montar uma única vez, na importação, as estruturas derivadas das tabelas acima"""
         
-        # Combinações preditivas de alto risco
-        self.high_risk_combinations = [
-            {
-                "profile": "High D + Low S",
-                "risk_score": 0.78,
-                "risk_description": "Aggressive behaviors, relationship conflicts",
-                "intervention": "Anger management, empathy training"
-            },
-            {
-                "profile": "High C + Low I",
-                "risk_score": 0.82,
-                "risk_description": "Social isolation, depression",
-                "intervention": "Social skills training, exposure therapy"
-            }
+        # Correlações indexadas pela letra DISC ("Dominance_D" -> "D"):
+        # letra -> ((transtorno, correlação, significância, descrição), ...)
+        cls._by_letter = {}
+        for style_name, disorders in cls.research_correlations.items():
+            letter = style_name.rsplit("_", 1)[1]
+            cls._by_letter[letter] = tuple(
+                (disorder, data["correlation"], data["significance"], data["description"])
+                for disorder, data in disorders.items()
+            )
+        
+        # Transtornos em estrutura de arrays (SoA), um índice k por transtorno: a análise
+        # vira um gather do score do estilo correspondente e uma multiplicação
+        disorders = [
+            (entry, style_idx)
+            for style_idx, style in enumerate(DISC_STYLES)
+            for entry in cls._by_letter.get(style, ())
         ]
+        cls._disorder_styles = np.array([style_idx for _, style_idx in disorders], dtype=np.uint8)
+        cls._disorder_corr = np.array([entry[1] for entry, _ in disorders], dtype=np.float64)
+        cls._disorder_corr32 = cls._disorder_corr.astype(np.float32)
+        
+        # Índices k dos transtornos de cada estilo (D, I, S, C)
+        cls._disorders_by_style = tuple(
+            tuple(k for k, (_, style_idx) in enumerate(disorders) if style_idx == target)
+            for target in range(len(DISC_STYLES))
+        )
+        
+        # Tabelas de exibição, na mesma ordem
+        cls.disorder_names = tuple(entry[0] for entry, _ in disorders)
+        cls._correlations = tuple(entry[1] for entry, _ in disorders)
+        cls._significances = tuple(entry[2] for entry, _ in disorders)
+        cls._descriptions = tuple(entry[3] for entry, _ in disorders)
+        
+        # Caminho individual: letra -> ((k, correlação), ...)
+        cls._risk_table = {
+            style: tuple((k, cls._correlations[k]) for k in cls._disorders_by_style[style_idx])
+            for style_idx, style in enumerate(DISC_STYLES)
+        }
+        
+        # Regras das combinações compiladas uma única vez a partir do perfil
+        # ("High D + Low S" -> estilo alto D >= 70 e estilo baixo S <= 30)
+        rules = []
+        for combo in cls.high_risk_combinations:
+            high_part, low_part = combo["profile"].split(" + ")
+            rules.append((
+                DISC_STYLES.index(high_part.split()[-1]), HIGH_SCORE,
+                DISC_STYLES.index(low_part.split()[-1]), LOW_SCORE
+            ))
+        
+        # Caminho individual: regras indexadas pela letra do estilo alto,
+        # letra alta -> ((posição em high_risk_combinations, letra baixa), ...)
+        cls._combo_table = {}
+        for order, (high_idx, _, low_idx, _) in enumerate(rules):
+            cls._combo_table.setdefault(DISC_STYLES[high_idx], []).append((order, DISC_STYLES[low_idx]))
+        
+        # Caminho em lote: as mesmas regras em arrays, na ordem de high_risk_combinations
+        high_idx, high_th, low_idx, low_th = zip(*rules)
+        cls._combo_high_idx = np.array(high_idx, dtype=np.intp)
+        cls._combo_high_th = np.array(high_th)
+        cls._combo_low_idx = np.array(low_idx, dtype=np.intp)
+        cls._combo_low_th = np.array(low_th)
+    
+    def __init__(self):
+        # Scores DISC são inteiros 0-100: perfis repetidos em equipes reaproveitam o resultado
+        self._analyze_cached = lru_cache(maxsize=4096)(self._compute_personality_risk)
     
-    def analyze_personality_risk(self, disc_scores: Dict) -> Dict:
-        """Analisar risco de transtornos de personalidade"""
+    def analyze_personality_risk(self, disc_scores: Dict, threshold: float = None) -> Dict:
+        """
+        Analisar risco de transtornos de personalidade
+        
+        Com threshold, apenas os transtornos com risk_score acima do limiar são
+        retornados (o risco geral continua considerando todos os identificados).
+        
+        A parte cara do cálculo é memoizada pela tupla de scores em forma imutável;
+        cada chamada recebe um dict novo, que o chamador pode modificar livremente.
+        """
+        identified, combo = self._analyze_cached(tuple(disc_scores.items()))
+        return self._build_analysis(identified, combo, threshold)
+    
+    def analyze_batch(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Calcular o risco de cada transtorno para vários perfis em uma única operação vetorizada
+        
+        Args:
+            scores: Matriz (N, 4) de scores DISC na ordem D, I, S, C
+                (float32 recomendado para lotes grandes e usa o kernel numba, quando
+                instalado; qualquer outro dtype, inclusive inteiro, é calculado em
+                float64, com a mesma precisão do dict)
+        
+        Returns:
+            np.ndarray: Matriz (N, K) de risco, colunas na ordem de self.disorder_names
+                (float32 para entrada float32, float64 nos demais casos)
+        """
+        scores = np.asarray(scores)
+        if scores.dtype == np.float32:
+            risk_kernel = _load_risk_kernel()
+            if risk_kernel is not None:
+                # Lotes float32 com numba disponível: laço compilado, sem temporários
+                scores = np.ascontiguousarray(scores)
+                return risk_kernel(scores, self._disorder_styles, self._disorder_corr32, np.float32(HIGH_SCORE))
+            corr = self._disorder_corr32
+        else:
+            corr = self._disorder_corr
+        
+        scores = scores.astype(corr.dtype, copy=False)[:, self._disorder_styles]
+        return np.where(scores >= HIGH_SCORE, scores / 100, 0) * corr
+    
+    def analyze_dataframe(self, df) -> np.ndarray:
+        """
+        Calcular o risco de cada transtorno para todas as linhas de um DataFrame
+        
+        Args:
+            df: DataFrame (pandas) com as colunas D, I, S e C
+        
+        Returns:
+            np.ndarray: Matriz (N, K) de risco, colunas na ordem de self.disorder_names
+        """
+        # Colunas contíguas em float32: uma única chamada ao kernel em vez de uma por linha
+        scores = df[list(DISC_STYLES)].to_numpy(dtype=np.float32, copy=False)
+        return self.analyze_batch(scores)
+    
+    def _compute_personality_risk(self, score_items: tuple) -> tuple:
+        """
+        Calcular, em Python puro, os transtornos identificados ((k, risco), ...) e o
+        índice da combinação de alto risco (ou None) de uma tupla ((estilo, score), ...)
+        """
+        
+        # Transtornos dos estilos com score alto, na ordem das chaves de entrada
+        identified = []
+        for style, score in score_items:
+            if score >= HIGH_SCORE:
+                for k, correlation in self._risk_table.get(style, ()):
+                    identified.append((k, score / 100 * correlation))
+        
+        # Combinação de alto risco: apenas as regras dos estilos com score alto
+        # (vale a primeira da lista, como na busca sequencial)
+        disc_scores = dict(score_items)
+        matches = [
+            order
+            for style, rules in self._combo_table.items() if disc_scores.get(style, 0) >= HIGH_SCORE
+            for order, low_style in rules if disc_scores.get(low_style, 0) <= LOW_SCORE
+        ]
+        
+        return tuple(identified), min(matches) if matches else None
+    
+    def analyze_bulk(self, disc_scores_list: List[Dict], threshold: float = None) -> List[Dict]:
+        """
+        Analisar muitos perfis DISC de uma vez
+        
+        Os perfis são empilhados em uma única matriz (N, 4) e analisados pelo caminho
+        vetorizado; o resultado segue a ordem de entrada e é igual ao de
+        analyze_personality_risk para cada perfil.
+        """
+        scores = []
+        orders = []
+        order_by_keys = {}  # perfis com as mesmas chaves compartilham a ordem dos transtornos
+        for disc_scores in disc_scores_list:
+            scores.append([disc_scores.get(style, 0) for style in DISC_STYLES])
+            keys = tuple(disc_scores)
+            order = order_by_keys.get(keys)
+            if order is None:
+                order = order_by_keys[keys] = tuple(
+                    k for style in keys for k, _ in self._risk_table.get(style, ())
+                )
+            orders.append(order)
+        return self._build_analyses(scores, threshold, orders)
+    
+    def _build_analyses(self, scores, threshold: float = None, orders: List[tuple] = None) -> List[Dict]:
+        """
+        Montar os dicts de análise de uma matriz (N, 4) de scores D, I, S, C em lote
+        
+        orders traz, por perfil, os índices k dos transtornos na ordem das chaves do
+        dict de entrada (padrão: ordem D, I, S, C); veja _build_analysis.
+        """
+        
+        scores = np.asarray(scores, dtype=np.float64).reshape(-1, len(DISC_STYLES))
+        risks = self.analyze_batch(scores).tolist()
+        identified = (scores[:, self._disorder_styles] >= HIGH_SCORE).tolist()
+        matches = self.match_combinations_batch(scores)
+        combos = np.where(matches.any(axis=1), matches.argmax(axis=1), -1).tolist()
+        if orders is None:
+            orders = [tuple(range(len(self.disorder_names)))] * len(risks)
+        return [
+            self._build_analysis(
+                [(k, row_risks[k]) for k in order if row_identified[k]],
+                combo if combo >= 0 else None,
+                threshold
+            )
+            for row_risks, row_identified, combo, order in zip(risks, identified, combos, orders)
+        ]
+    
+    def _build_analysis(self, identified, combo: int = None, threshold: float = None) -> Dict:
+        """
+        Montar o dict de análise a partir dos transtornos identificados, pares
+        (k, risco) na ordem das chaves do dict de entrada, e do índice da
+        combinação de alto risco atendida (ou None)
+        
+        Os transtornos são inseridos e somados nessa ordem, como no cálculo
+        sequencial, o que mantém a ordem das chaves e o risco geral idênticos bit a bit.
+        """
         
         analysis = {
             "personality_disorder_risks": {},
@@ -77,33 +345,22 @@ class PersonalityDisorderDemo:
             "professional_oversight_required": False
         }
         
-        # Analisar cada perfil DISC
-        for style, score in disc_scores.items():
-            if score >= 70:  # Score alto
-                style_name = f"{self._get_style_full_name(style)}_" + style
-                style_data = self.research_correlations.get(style_name, {})
-                
-                for disorder, data in style_data.items():
-                    if isinstance(data, dict) and "correlation" in data:
-                        risk_score = data["correlation"] * (score / 100)
-                        analysis["personality_disorder_risks"][disorder] = {
-                            "risk_score": risk_score,
-                            "correlation": data["correlation"],
-                            "significance": data["significance"],
-                            "description": data["description"]
-                        }
-        
-        # Verificar combinações de alto risco
-        for combo in self.high_risk_combinations:
-            if self._matches_combination(disc_scores, combo["profile"]):
-                analysis["high_risk_combination"] = combo
-                break
+        # Dos transtornos identificados, apenas os significativos
+        for k, risk_score in identified:
+            if threshold is None or risk_score > threshold:
+                analysis["personality_disorder_risks"][self.disorder_names[k]] = {
+                    "risk_score": risk_score,
+                    "correlation": self._correlations[k],
+                    "significance": self._significances[k],
+                    "description": self._descriptions[k]
+                }
+        
+        if combo is not None:
+            analysis["high_risk_combination"] = dict(self.high_risk_combinations[combo])
         
         # Calcular risco geral
-        if analysis["personality_disorder_risks"]:
-            avg_risk = sum(
-                data["risk_score"] for data in analysis["personality_disorder_risks"].values()
-            ) / len(analysis["personality_disorder_risks"])
+        if identified:
+            avg_risk = sum(risk_score for _, risk_score in identified) / len(identified)
             analysis["overall_risk_score"] = avg_risk * 100
         
         # Determinar necessidade de supervisão
@@ -114,30 +371,30 @@ class PersonalityDisorderDemo:
         
         return analysis
     
-    def _get_style_full_name(self, style: str) -> str:
-        """Converter letra DISC para nome completo"""
-        mapping = {
-            'D': 'Dominance',
-            'I': 'Influence',
-            'S': 'Steadiness',
-            'C': 'Conscientiousness'
-        }
-        return mapping.get(style, style)
-    
-    def _matches_combination(self, disc_scores: Dict, profile_description: str) -> bool:
-        """Verificar se scores correspondem à combinação"""
-        if "High D + Low S" in profile_description:
-            return disc_scores.get('D', 0) >= 70 and disc_scores.get('S', 0) <= 30
-        elif "High C + Low I" in profile_description:
-            return disc_scores.get('C', 0) >= 70 and disc_scores.get('I', 0) <= 30
-        return False
+    def match_combinations_batch(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Avaliar todas as combinações de alto risco para vários perfis de uma vez
+        
+        Args:
+            scores: Matriz (N, 4) de scores DISC na ordem D, I, S, C
+        
+        Returns:
+            np.ndarray: Matriz booleana (N, R), colunas na ordem de high_risk_combinations
+        """
+        scores = np.asarray(scores)
+        return (
+            (scores[:, self._combo_high_idx] >= self._combo_high_th)
+            & (scores[:, self._combo_low_idx] <= self._combo_low_th)
+        )
     
     def demonstrate_value_added(self):
         """Demonstrar valor agregado do código"""
         
-        print("🚀 MIND-BRIDGE: DIFERENCIAL COMPETITIVO REVOLUCIONÁRIO")
-        print("🔬 Primeira Plataforma Mundial com Correlações DISC x DSM-5")
-        print("=" * 80)
+        out = io.StringIO()
+        
+        print("🚀 MIND-BRIDGE: DIFERENCIAL COMPETITIVO REVOLUCIONÁRIO", file=out)
+        print("🔬 Primeira Plataforma Mundial com Correlações DISC x DSM-5", file=out)
+        print("=" * 80, file=out)
         
         # Casos de teste demonstrando cada transtorno
         test_cases = [
@@ -167,120 +424,91 @@ class PersonalityDisorderDemo:
             }
         ]
         
-        for i, case in enumerate(test_cases, 1):
-            print(f"\n📊 CASO {i}: {case['name']} (Perfil {case['profile']})")
-            print(f"   Contexto: {case['context']}")
-            print(f"   Scores DISC: {case['scores']}")
-            
-            # Executar análise
-            analysis = self.analyze_personality_risk(case['scores'])
+        # Executar a análise de todos os casos em um único lote
+        analyses = self._build_analyses(
+            [[case['scores'].get(style, 0) for style in DISC_STYLES] for case in test_cases]
+        )
+        
+        for i, (case, analysis) in enumerate(zip(test_cases, analyses), 1):
+            print(f"\n📊 CASO {i}: {case['name']} (Perfil {case['profile']})", file=out)
+            print(f"   Contexto: {case['context']}", file=out)
+            print(f"   Scores DISC: {case['scores']}", file=out)
             
             # Mostrar resultados
-            print(f"   🎯 Risco Geral: {analysis['overall_risk_score']:.1f}/100")
+            print(f"   🎯 Risco Geral: {analysis['overall_risk_score']:.1f}/100", file=out)
             
             if analysis['personality_disorder_risks']:
-                print("   ⚠️  Transtornos Identificados:")
+                print("   ⚠️  Transtornos Identificados:", file=out)
                 for disorder, data in analysis['personality_disorder_risks'].items():
-                    print(f"      • {disorder.replace('_', ' ').title()}: {data['risk_score']:.3f}")
-                    print(f"        Correlação: {data['correlation']} ({data['significance']})")
+                    print(f"      • {disorder.replace('_', ' ').title()}: {data['risk_score']:.3f}", file=out)
+                    print(f"        Correlação: {data['correlation']} ({data['significance']})", file=out)
             
             if analysis['high_risk_combination']:
                 combo = analysis['high_risk_combination']
-                print(f"   🚨 Combinação de Risco: {combo['profile']}")
-                print(f"      Intervenção: {combo['intervention']}")
+                print(f"   🚨 Combinação de Risco: {combo['profile']}", file=out)
+                print(f"      Intervenção: {combo['intervention']}", file=out)
             
             oversight = "SIM" if analysis['professional_oversight_required'] else "NÃO"
-            print(f"   👨‍⚕️ Supervisão Profissional: {oversight}")
+            print(f"   👨‍⚕️ Supervisão Profissional: {oversight}", file=out)
         
         # Demonstrar diferencial competitivo
-        print(f"\n🏆 DIFERENCIAL COMPETITIVO ÚNICO")
-        print("-" * 50)
-        
-        print("✅ ANTES (Sistemas Existentes):")
-        print("• Análise DISC básica")
-        print("• Correlações genéricas com saúde mental")
-        print("• Recomendações padronizadas")
-        print("• Sem base científica específica")
-        
-        print("\n🚀 DEPOIS (Mind-Bridge Enhanced):")
-        print("• Correlações específicas com transtornos DSM-5")
-        print("• Análise de combinações preditivas")
-        print("• Intervenções baseadas em evidências")
-        print("• Supervisão profissional direcionada")
-        print("• Conformidade com padrões clínicos internacionais")
+        print(f"\n🏆 DIFERENCIAL COMPETITIVO ÚNICO", file=out)
+        print("-" * 50, file=out)
+        
+        print("✅ ANTES (Sistemas Existentes):", file=out)
+        print("• Análise DISC básica", file=out)
+        print("• Correlações genéricas com saúde mental", file=out)
+        print("• Recomendações padronizadas", file=out)
+        print("• Sem base científica específica", file=out)
+        
+        print("\n🚀 DEPOIS (Mind-Bridge Enhanced):", file=out)
+        print("• Correlações específicas com transtornos DSM-5", file=out)
+        print("• Análise de combinações preditivas", file=out)
+        print("• Intervenções baseadas em evidências", file=out)
+        print("• Supervisão profissional direcionada", file=out)
+        print("• Conformidade com padrões clínicos internacionais", file=out)
         
         # Valor de mercado
-        print(f"\n💰 IMPACTO NO MODELO DE NEGÓCIOS")
-        print("-" * 45)
+        print(f"\n💰 IMPACTO NO MODELO DE NEGÓCIOS", file=out)
+        print("-" * 45, file=out)
         
-        print("📈 JUSTIFICATIVA PARA PREÇOS PREMIUM:")
-        print("• Análise Básica: €35 → €45 (+28%)")
-        print("• Análise com DSM-5: €65 (novo tier)")
-        print("• Enterprise Premium: €899/mês")
+        print("📈 JUSTIFICATIVA PARA PREÇOS PREMIUM:", file=out)
+        print("• Análise Básica: €35 → €45 (+28%)", file=out)
+        print("• Análise com DSM-5: €65 (novo tier)", file=out)
+        print("• Enterprise Premium: €899/mês", file=out)
         
-        print("\n🎯 DIFERENCIAÇÃO ABSOLUTA:")
-        print("• ÚNICO no mercado com correlações DSM-5")
-        print("• PRIMEIRA plataforma com combinações preditivas")
-        print("• ÚNICA solução com supervisão baseada em evidências")
+        print("\n🎯 DIFERENCIAÇÃO ABSOLUTA:", file=out)
+        print("• ÚNICO no mercado com correlações DSM-5", file=out)
+        print("• PRIMEIRA plataforma com combinações preditivas", file=out)
+        print("• ÚNICA solução com supervisão baseada em evidências", file=out)
         
         # Correlações mais impressionantes
-        print(f"\n🔬 CORRELAÇÕES CIENTÍFICAS VALIDADAS")
-        print("-" * 50)
-        
-        impressive_correlations = [
-            ("Perfil C", "Personalidade Esquizoide", 0.61, "p < 0.01"),
-            ("Perfil C", "Personalidade Evitativa", 0.58, "p < 0.01"),
-            ("Perfil D", "Personalidade Antissocial", 0.43, "p < 0.01"),
-            ("Perfil S", "Personalidade Dependente", 0.41, "p < 0.01")
-        ]
+        print(f"\n🔬 CORRELAÇÕES CIENTÍFICAS VALIDADAS", file=out)
+        print("-" * 50, file=out)
         
-        for profile, disorder, correlation, significance in impressive_correlations:
-            print(f"• {profile} x {disorder}: r={correlation} ({significance})")
+        for profile, disorder, correlation, significance in _IMPRESSIVE_CORRELATIONS:
+            print(f"• {profile} x {disorder}: r={correlation} ({significance})", file=out)
         
-        print(f"\n🌟 RESULTADO: Mind-Bridge agora possui o diferencial mais avançado do mundo!")
-        print(f"🚀 Pronto para dominar o mercado europeu de €19.5 bilhões!")
+        print(f"\n🌟 RESULTADO: Mind-Bridge agora possui o diferencial mais avançado do mundo!", file=out)
+        print(f"🚀 Pronto para dominar o mercado europeu de €19.5 bilhões!", file=out)
         
+        sys.stdout.write(out.getvalue())
         return analysis
 
 
+PersonalityDisorderDemo._compile_tables()
+
+
 def demonstrate_competitive_advantage():
     """Demonstrar vantagem competitiva específica"""
     
     print("\n🎯 ANÁLISE DE VANTAGEM COMPETITIVA")
     print("=" * 50)
     
-    advantages = [
-        {
-            "category": "Científica",
-            "description": "Primeira plataforma com correlações DSM-5 validadas",
-            "impact": "Credibilidade clínica absoluta"
-        },
-        {
-            "category": "Técnica", 
-            "description": "Algoritmos preditivos baseados em combinações DISC",
-            "impact": "Precisão diagnóstica superior"
-        },
-        {
-            "category": "Regulatória",
-            "description": "Conformidade com padrões clínicos internacionais",
-            "impact": "Acesso a mercados regulamentados"
-        },
-        {
-            "category": "Comercial",
-            "description": "Justificativa para preços premium",
-            "impact": "Margens de lucro superiores"
-        },
-        {
-            "category": "Estratégica",
-            "description": "Barreira de entrada técnica e científica",
-            "impact": "Proteção contra concorrência"
-        }
-    ]
-    
-    for adv in advantages:
-        print(f"\n🏆 {adv['category'].upper()}:")
-        print(f"   Diferencial: {adv['description']}")
-        print(f"   Impacto: {adv['impact']}")
+    for category, description, impact in _ADVANTAGES:
+        print(f"\n🏆 {category.upper()}:")
+        print(f"   Diferencial: {description}")
+        print(f"   Impacto: {impact}")
     
     print(f"\n🚀 CONCLUSÃO: O código agregado transforma o Mind-Bridge de uma")
     print(f"   solução inovadora para a ÚNICA plataforma com diferencial")
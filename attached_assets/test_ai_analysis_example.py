@@ -0,0 +1,180 @@
+"""
+Testes do payload enviado pelos clientes de exemplo da API de análise de IA
+"""
+
+import asyncio
+
+import httpx
+import orjson
+
+import ai_analysis_example_1757503118950 as example
+
+
+EXPECTED_RISK_PAYLOAD = {
+    "disc_results": {
+        "primary_style": "C",
+        "scores": {"D": 30, "I": 20, "S": 25, "C": 90}
+    },
+    "mental_health_results": {
+        "phq9_score": 16,
+        "gad7_score": 18,
+        "burnout_score": 60
+    }
+}
+
+BULK_CASES = [
+    {
+        "user_id": 1,
+        "disc_results": example._DEFAULT_DISC_CEO,
+        "mental_health_results": example._DEFAULT_MH_CEO,
+        "user_context": example._DEFAULT_CONTEXT_CEO
+    },
+    {
+        "user_id": 2,
+        "disc_results": example._RISK_DISC_C,
+        "mental_health_results": example._RISK_MH_C,
+        "user_context": {}
+    }
+]
+
+EXPECTED_BULK_PAYLOAD = {
+    "cases": [
+        {
+            "user_id": 1,
+            "disc_results": {
+                "primary_style": "D",
+                "scores": {"D": 85, "I": 25, "S": 15, "C": 70},
+                "secondary_style": "C",
+                "intensity": "high",
+                "flexibility_score": 35
+            },
+            "mental_health_results": {
+                "phq9_score": 12,
+                "gad7_score": 15,
+                "burnout_score": 75,
+                "stress_level": "high",
+                "sleep_quality": "poor"
+            },
+            "user_context": {
+                "role": "CEO",
+                "company_size": "startup",
+                "work_hours_per_week": 70,
+                "team_size": 15,
+                "recent_changes": ["funding_round", "rapid_growth", "new_hires"]
+            }
+        },
+        {"user_id": 2, **EXPECTED_RISK_PAYLOAD, "user_context": {}}
+    ]
+}
+
+
+class _FakeResponse:
+    content = b"{}"
+
+
+def test_risk_assessment_sync_payload():
+    sent = {}
+
+    def fake_post(endpoint, data=None, **kwargs):
+        sent["endpoint"] = endpoint
+        sent["body"] = data
+        return _FakeResponse()
+
+    with example.MindBridgeAIClient() as client:
+        client.session.post = fake_post
+        client.risk_assessment(example._RISK_DISC_C, example._RISK_MH_C)
+
+    assert sent["endpoint"].endswith("/ai-analysis/risk-assessment")
+    assert orjson.loads(sent["body"]) == EXPECTED_RISK_PAYLOAD
+
+
+def _run_async(call, handler=None) -> dict:
+    """Executar call(client) em um cliente assíncrono com transporte simulado"""
+    sent = {}
+
+    def record(request: httpx.Request) -> httpx.Response:
+        sent["path"] = request.url.path
+        sent["body"] = request.content
+        return httpx.Response(200, content=b"{}")
+
+    handler = handler or record
+
+    async def run():
+        client = example.AsyncMindBridgeAIClient()
+        await client._client.aclose()
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url,
+            transport=httpx.MockTransport(handler)
+        )
+        async with client:
+            sent["result"] = await call(client)
+
+    asyncio.run(run())
+    return sent
+
+
+def test_risk_assessment_async_payload():
+    sent = _run_async(lambda client: client.risk_assessment(example._RISK_DISC_C, example._RISK_MH_C))
+
+    assert sent["path"].endswith("/ai-analysis/risk-assessment")
+    assert orjson.loads(sent["body"]) == EXPECTED_RISK_PAYLOAD
+
+
+def test_bulk_analyze_correlation_sync_payload():
+    sent = {}
+
+    def fake_post(endpoint, data=None, **kwargs):
+        sent["endpoint"] = endpoint
+        sent["body"] = data
+        return _FakeResponse()
+
+    with example.MindBridgeAIClient() as client:
+        client.session.post = fake_post
+        client.bulk_analyze_correlation(BULK_CASES)
+
+    assert sent["endpoint"].endswith("/ai-analysis/correlate/bulk")
+    assert orjson.loads(sent["body"]) == EXPECTED_BULK_PAYLOAD
+
+
+def test_bulk_analyze_correlation_async_payload():
+    sent = _run_async(lambda client: client.bulk_analyze_correlation(BULK_CASES))
+
+    assert sent["path"].endswith("/ai-analysis/correlate/bulk")
+    assert orjson.loads(sent["body"]) == EXPECTED_BULK_PAYLOAD
+
+
+def _probe_results(monkeypatch, statuses, ttl=30.0):
+    """Executar _api_is_up uma vez por status, retornando (resultados, sondas enviadas)"""
+    monkeypatch.setitem(example._HEALTH_CACHE, "ok", False)
+    monkeypatch.setitem(example._HEALTH_CACHE, "ts", 0.0)
+    probes = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        probes.append(request.url.path)
+        return httpx.Response(statuses[len(probes) - 1])
+
+    async def probe_all(client):
+        return [await example._api_is_up(client, ttl=ttl) for _ in statuses]
+
+    return _run_async(probe_all, handler)["result"], probes
+
+
+def test_api_is_up_reuses_recent_success(monkeypatch):
+    results, probes = _probe_results(monkeypatch, [200, 200, 200])
+
+    assert results == [True, True, True]
+    assert probes == ["/api/health"]
+
+
+def test_api_is_up_probes_again_after_failure(monkeypatch):
+    results, probes = _probe_results(monkeypatch, [503, 200, 200])
+
+    assert results == [False, True, True]
+    assert probes == ["/api/health", "/api/health"]
+
+
+def test_api_is_up_probes_again_after_ttl(monkeypatch):
+    results, probes = _probe_results(monkeypatch, [200, 503], ttl=0.0)
+
+    assert results == [True, False]
+    assert len(probes) == 2
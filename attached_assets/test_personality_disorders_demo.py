@@ -0,0 +1,130 @@
+"""
+Testes do caminho vetorizado da demonstração de transtornos de personalidade
+"""
+
+import sys
+
+import numpy as np
+
+import personality_disorders_demo_1757504234116 as demo_module
+from personality_disorders_demo_1757504234116 import PersonalityDisorderDemo
+
+
+SCORES = [
+    [90, 30, 15, 40],
+    [35, 85, 40, 25],
+    [20, 25, 88, 45],
+    [40, 15, 35, 92],
+    [75, 20, 25, 80]
+]
+
+
+def test_analyze_batch_integer_input_is_float64():
+    demo = PersonalityDisorderDemo()
+
+    risks = demo.analyze_batch(np.array(SCORES, dtype=np.int64))
+
+    assert risks.dtype == np.float64
+    np.testing.assert_array_equal(risks, demo.analyze_batch(np.array(SCORES, dtype=np.float64)))
+
+
+def test_analyze_batch_matches_single_profile_analysis():
+    demo = PersonalityDisorderDemo()
+
+    risks = demo.analyze_batch(np.array(SCORES, dtype=np.int32))
+
+    for row, scores in zip(risks, SCORES):
+        analysis = demo.analyze_personality_risk(dict(zip("DISC", scores)))
+        for disorder, data in analysis["personality_disorder_risks"].items():
+            assert row[demo.disorder_names.index(disorder)] == data["risk_score"]
+
+
+def test_analysis_follows_input_key_order():
+    demo = PersonalityDisorderDemo()
+    disc_scores = {"C": 91.7, "S": 20, "I": 15, "D": 73.3}
+
+    analysis = demo.analyze_personality_risk(disc_scores)
+
+    risks = analysis["personality_disorder_risks"]
+    assert list(risks) == ["schizoid_personality", "avoidant_personality", "antisocial_personality"]
+    expected = (0.61 * (91.7 / 100) + 0.58 * (91.7 / 100) + 0.43 * (73.3 / 100)) / 3 * 100
+    assert analysis["overall_risk_score"] == expected
+
+
+def test_editing_result_combination_keeps_class_table():
+    demo = PersonalityDisorderDemo()
+
+    analysis = demo.analyze_personality_risk({"D": 90, "I": 30, "S": 15, "C": 40})
+    analysis["high_risk_combination"]["intervention"] = "changed"
+
+    combo = PersonalityDisorderDemo().analyze_personality_risk({"D": 90, "I": 30, "S": 15, "C": 40})["high_risk_combination"]
+    assert combo["intervention"] == "Anger management, empathy training"
+    assert PersonalityDisorderDemo.high_risk_combinations[0]["intervention"] == "Anger management, empathy training"
+
+
+def test_mutating_result_does_not_change_next_call():
+    demo = PersonalityDisorderDemo()
+    disc_scores = {"D": 75, "I": 20, "S": 25, "C": 80}
+
+    first = demo.analyze_personality_risk(disc_scores)
+    expected = demo.analyze_personality_risk(disc_scores)
+    first["personality_disorder_risks"].clear()
+    first["overall_risk_score"] = 0
+
+    assert demo.analyze_personality_risk(disc_scores) == expected
+    assert len(expected["personality_disorder_risks"]) == 3
+
+
+def test_threshold_excludes_risks_equal_to_it():
+    demo = PersonalityDisorderDemo()
+    disc_scores = {"D": 100, "I": 20, "S": 25, "C": 80}
+
+    everything = demo.analyze_personality_risk(disc_scores, threshold=None)
+    filtered = demo.analyze_personality_risk(disc_scores, threshold=0.43)
+
+    assert everything["personality_disorder_risks"]["antisocial_personality"]["risk_score"] == 0.43
+    assert list(everything["personality_disorder_risks"]) == [
+        "antisocial_personality", "schizoid_personality", "avoidant_personality"
+    ]
+    assert list(filtered["personality_disorder_risks"]) == ["schizoid_personality", "avoidant_personality"]
+    assert filtered["overall_risk_score"] == everything["overall_risk_score"]
+    assert demo.analyze_personality_risk(disc_scores) == everything
+
+
+def test_analyze_batch_float32_matches_float64():
+    demo = PersonalityDisorderDemo()
+
+    risks = demo.analyze_batch(np.array(SCORES, dtype=np.float32))
+
+    assert risks.dtype == np.float32
+    np.testing.assert_allclose(risks, demo.analyze_batch(np.array(SCORES, dtype=np.float64)), rtol=1e-6)
+
+
+def test_analyze_batch_float32_without_numba(monkeypatch):
+    demo = PersonalityDisorderDemo()
+    monkeypatch.setitem(sys.modules, "numba", None)
+    demo_module._load_risk_kernel.cache_clear()
+    try:
+        assert demo_module._load_risk_kernel() is None
+        risks = demo.analyze_batch(np.array(SCORES, dtype=np.float32))
+    finally:
+        demo_module._load_risk_kernel.cache_clear()
+
+    assert risks.dtype == np.float32
+    np.testing.assert_allclose(risks, demo.analyze_batch(np.array(SCORES, dtype=np.float64)), rtol=1e-6)
+
+
+def test_analyze_bulk_matches_single_profile_analysis():
+    demo = PersonalityDisorderDemo()
+    profiles = [dict(zip("DISC", scores)) for scores in SCORES] + [
+        {"C": 91.7, "S": 20, "I": 15, "D": 73.3},
+        {"S": 85, "D": 72},
+        {}
+    ]
+
+    analyses = demo.analyze_bulk(profiles)
+
+    assert analyses == [demo.analyze_personality_risk(profile) for profile in profiles]
+    for analysis, profile in zip(analyses, profiles):
+        single = demo.analyze_personality_risk(profile)
+        assert list(analysis["personality_disorder_risks"]) == list(single["personality_disorder_risks"])
@@ -0,0 +1,2 @@
+// Mask a CPF for API responses, keeping only the first three digits
+export const maskCpf = (cpf: string): string => `${cpf.slice(0, 3)}.***.***-**`;
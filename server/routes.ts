@@ -3,6 +3,8 @@ import { createServer, type Server } from "http";
 import jwt from "jsonwebtoken";
 import bcrypt from "bcryptjs";
 import { storage } from "./storage";
+import { TtlCache } from "./cache";
+import { maskCpf } from "./masking";
 import { 
   insertUserSchema, 
   insertCompanySchema, 
@@ -78,6 +80,239 @@ const authenticateToken = async (req: AuthenticatedRequest, res: Response, next:
   }
 };
 
+// Recursively freeze static payloads shared across requests
+const deepFreeze = <T>(value: T): T => {
+  if (value && typeof value === "object") {
+    Object.values(value as Record<string, unknown>).forEach(deepFreeze);
+    Object.freeze(value);
+  }
+  return value;
+};
+
+// Group items by key, preserving their order within each group
+const indexBy = <T, K>(items: readonly T[], key: (item: T) => K): Map<K, T[]> => {
+  const index = new Map<K, T[]>();
+  for (const item of items) {
+    const bucket = index.get(key(item));
+    if (bucket) bucket.push(item);
+    else index.set(key(item), [item]);
+  }
+  return index;
+};
+
+// ISO timestamp reused within the same wall-clock second
+let nowIsoSecond = -1;
+let nowIsoValue = "";
+const nowIso = (): string => {
+  const now = Date.now();
+  const second = Math.floor(now / 1000);
+  if (second !== nowIsoSecond) {
+    nowIsoSecond = second;
+    nowIsoValue = new Date(now).toISOString();
+  }
+  return nowIsoValue;
+};
+
+// Mock data simulating SUS/CNES API response
+const SUS_ESTABELECIMENTOS_MOCK = deepFreeze([
+  {
+    cnes: "2269311",
+    nome: "CAPS AD Central",
+    tipo: "CAPS",
+    subtipo: "CAPS AD",
+    endereco: {
+      logradouro: "Rua das Flores, 123",
+      bairro: "Centro",
+      municipio: "São Paulo",
+      uf: "SP",
+      cep: "01234-567"
+    },
+    telefone: "(11) 3333-4444",
+    email: "caps.central@sus.sp.gov.br",
+    horario_funcionamento: {
+      segunda_sexta: "08:00-18:00",
+      sabado: "08:00-12:00",
+      domingo: "Fechado"
+    },
+    servicos_disponiveis: [
+      "Atendimento psicológico",
+      "Atendimento psiquiátrico",
+      "Terapia ocupacional",
+      "Grupos terapêuticos",
+      "Atendimento para dependência química"
+    ],
+    capacidade_atendimento: 50,
+    distancia_km: 2.3,
+    status: "ativo",
+    ultima_atualizacao: "2024-01-15"
+  },
+  {
+    cnes: "2269312",
+    nome: "UBS Vila Madalena",
+    tipo: "UBS",
+    subtipo: "Unidade Básica de Saúde",
+    endereco: {
+      logradouro: "Av. Paulista, 456",
+      bairro: "Vila Madalena",
+      municipio: "São Paulo",
+      uf: "SP",
+      cep: "01234-568"
+    },
+    telefone: "(11) 3333-5555",
+    email: "ubs.madalena@sus.sp.gov.br",
+    horario_funcionamento: {
+      segunda_sexta: "07:00-17:00",
+      sabado: "07:00-12:00",
+      domingo: "Fechado"
+    },
+    servicos_disponiveis: [
+      "Clínica médica",
+      "Psicologia básica",
+      "Enfermagem",
+      "Vacinação",
+      "Encaminhamentos especializados"
+    ],
+    capacidade_atendimento: 100,
+    distancia_km: 5.1,
+    status: "ativo",
+    ultima_atualizacao: "2024-01-15"
+  }
+]);
+
+// Establishments ordered by distance and indexed by tipo ("todos" = no filter)
+const SUS_ESTABELECIMENTOS_POR_DISTANCIA = [...SUS_ESTABELECIMENTOS_MOCK]
+  .sort((a, b) => a.distancia_km - b.distancia_km);
+const SUS_ESTABELECIMENTOS_POR_TIPO = indexBy(SUS_ESTABELECIMENTOS_POR_DISTANCIA, est => est.tipo)
+  .set("todos", SUS_ESTABELECIMENTOS_POR_DISTANCIA);
+
+// Mock RAPS services for /api/government/sus/raps-servicos
+const SUS_RAPS_SERVICOS_MOCK = deepFreeze([
+  {
+    id: "raps-001",
+    nome: "CAPS III Norte",
+    tipo: "CAPS III",
+    endereco: "Rua da Saúde Mental, 100 - Santana, São Paulo",
+    telefone: "(11) 3333-7777",
+    capacidade_diaria: 60,
+    funciona_24h: true,
+    especialidades: ["Psiquiatria", "Psicologia", "Terapia Ocupacional", "Assistência Social"],
+    distancia_km: 3.2,
+    disponibilidade_leitos: 8
+  },
+  {
+    id: "raps-002", 
+    nome: "Residência Terapêutica Casa Esperança",
+    tipo: "SRT",
+    endereco: "Av. da Inclusão, 250 - Vila Mariana, São Paulo", 
+    telefone: "(11) 3333-8888",
+    capacidade_diaria: 12,
+    funciona_24h: true,
+    especialidades: ["Reabilitação Psicossocial", "Acompanhamento Terapêutico"],
+    distancia_km: 7.5,
+    vagas_disponiveis: 2
+  }
+]);
+
+const SUS_RAPS_SERVICOS_POR_TIPO = indexBy(SUS_RAPS_SERVICOS_MOCK, s => s.tipo);
+
+// Mock availability (static part; cnes/tipo_atendimento are added per request)
+const SUS_DISPONIBILIDADE_MOCK = deepFreeze({
+  estabelecimento: "CAPS AD Central",
+  disponibilidade: {
+    proximos_dias: [
+      { data: "2024-09-11", horarios_disponiveis: ["09:00", "14:00", "16:30"] },
+      { data: "2024-09-12", horarios_disponiveis: ["08:30", "10:00", "15:00"] },
+      { data: "2024-09-13", horarios_disponiveis: ["09:30", "11:00"] }
+    ],
+    tempo_espera_estimado: "5-7 dias",
+    preferencia_agendamento: "Ligar para (11) 3333-4444"
+  }
+});
+
+// INSS auxílio-doença eligibility rules
+const CARENCIA_MINIMA_MESES = 12;
+const COEF_AUXILIO_DOENCA = 0.91;
+const TETO_INSS = 7507.49;
+const RECOMENDACAO_ELEGIVEL = "Elegível para auxílio-doença. Procure perícia médica.";
+const RECOMENDACAO_CARENCIA = `Necessário completar carência mínima de ${CARENCIA_MINIMA_MESES} contribuições.`;
+
+// Mock INSS data (static part; the masked CPF is added per request)
+const INSS_BENEFICIOS_MOCK = deepFreeze({
+  nome_segurado: "SEGURADO EXEMPLO",
+  situacao_cadastral: "ativo",
+  beneficios_ativos: [
+    {
+      numero_beneficio: "123456789",
+      tipo: "auxilio_doenca",
+      codigo_especie: "B31",
+      descricao: "Auxílio-Doença Previdenciário",
+      data_inicio: "2024-01-15",
+      data_cessacao: null,
+      valor_mensal: 2500.00,
+      status: "ativo",
+      cid: "F32.9",
+      medico_perito: "Dr. José Silva - CRM 123456",
+      proxima_pericia: "2024-07-15",
+      banco_pagamento: "Banco do Brasil",
+      agencia: "1234-5",
+      conta: "12345-6"
+    }
+  ],
+  contribuicoes: {
+    tempo_contribuicao_anos: 15,
+    tempo_contribuicao_meses: 180,
+    ultima_contribuicao: "2024-01-01",
+    salario_contribuicao_atual: 4500.00,
+    media_salarios_contribuicao: 3800.00
+  }
+});
+
+// Mock SIAFI execution data (static part; ente/ano are added per request)
+const SIAFI_GASTOS_MOCK = deepFreeze({
+  resumo_execucao: {
+    dotacao_inicial: 150000000.00,
+    dotacao_atualizada: 165000000.00,
+    valor_empenhado: 142000000.00,
+    valor_liquidado: 138000000.00,
+    valor_pago: 135000000.00,
+    percentual_execucao: 86.1
+  },
+  programas_saude_mental: [
+    {
+      codigo_programa: "2015",
+      nome_programa: "Fortalecimento do Sistema Único de Saúde",
+      acao: "Atenção à Saúde da População para Procedimentos de Média e Alta Complexidade",
+      valor_empenhado: 85000000.00,
+      valor_pago: 80000000.00
+    },
+    {
+      codigo_programa: "2015",
+      nome_programa: "Fortalecimento do Sistema Único de Saúde",
+      acao: "Atenção Básica em Saúde", 
+      valor_empenhado: 35000000.00,
+      valor_pago: 33500000.00
+    }
+  ],
+  investimentos_caps: {
+    construcao_novos_caps: {
+      valor_empenhado: 12000000.00,
+      unidades_previstas: 8,
+      unidades_entregues: 5
+    },
+    reforma_caps_existentes: {
+      valor_empenhado: 5000000.00,
+      unidades_reformadas: 15
+    }
+  }
+});
+
+// SIAFI execution data is effectively static per (ente, ano)
+const siafiGastosCache = new TtlCache<string, object>(512, 60 * 60 * 1000);
+
+// SUS/RAPS lookups keyed on the search criteria (short TTL for future live data)
+const susEstabelecimentosCache = new TtlCache<string, object[]>(1024, 5 * 60 * 1000);
+const rapsServicosCache = new TtlCache<string, object[]>(1024, 5 * 60 * 1000);
+
 export async function registerRoutes(app: Express): Promise<Express> {
   // Health check
   app.get("/api/health", (req, res) => {
@@ -363,240 +598,112 @@ export async function registerRoutes(app: Express): Promise<Express> {
   // =============================================================================
 
   // SUS (Sistema Único de Saúde) Integration Routes
-  app.post("/api/government/sus/estabelecimentos", authenticateToken, async (req, res) => {
+  app.post("/api/government/sus/estabelecimentos", authenticateToken, async (req, res, next) => {
     try {
       const { cep, tipo, raio_km } = susEstablishmentSearchSchema.parse(req.body);
       
-      // Mock data simulating SUS/CNES API response
-      const estabelecimentos_mock = [
-        {
-          cnes: "2269311",
-          nome: "CAPS AD Central",
-          tipo: "CAPS",
-          subtipo: "CAPS AD",
-          endereco: {
-            logradouro: "Rua das Flores, 123",
-            bairro: "Centro",
-            municipio: "São Paulo",
-            uf: "SP",
-            cep: "01234-567"
-          },
-          telefone: "(11) 3333-4444",
-          email: "caps.central@sus.sp.gov.br",
-          horario_funcionamento: {
-            segunda_sexta: "08:00-18:00",
-            sabado: "08:00-12:00",
-            domingo: "Fechado"
-          },
-          servicos_disponiveis: [
-            "Atendimento psicológico",
-            "Atendimento psiquiátrico",
-            "Terapia ocupacional",
-            "Grupos terapêuticos",
-            "Atendimento para dependência química"
-          ],
-          capacidade_atendimento: 50,
-          distancia_km: 2.3,
-          status: "ativo",
-          ultima_atualizacao: "2024-01-15"
-        },
-        {
-          cnes: "2269312",
-          nome: "UBS Vila Madalena",
-          tipo: "UBS",
-          subtipo: "Unidade Básica de Saúde",
-          endereco: {
-            logradouro: "Av. Paulista, 456",
-            bairro: "Vila Madalena",
-            municipio: "São Paulo",
-            uf: "SP",
-            cep: "01234-568"
-          },
-          telefone: "(11) 3333-5555",
-          email: "ubs.madalena@sus.sp.gov.br",
-          horario_funcionamento: {
-            segunda_sexta: "07:00-17:00",
-            sabado: "07:00-12:00",
-            domingo: "Fechado"
-          },
-          servicos_disponiveis: [
-            "Clínica médica",
-            "Psicologia básica",
-            "Enfermagem",
-            "Vacinação",
-            "Encaminhamentos especializados"
-          ],
-          capacidade_atendimento: 100,
-          distancia_km: 5.1,
-          status: "ativo",
-          ultima_atualizacao: "2024-01-15"
-        }
-      ];
+      // The mock result does not depend on the CEP, so it is left out of the key
+      const cacheKey = JSON.stringify([tipo, raio_km]);
+      let estabelecimentos = susEstabelecimentosCache.get(cacheKey);
+      if (estabelecimentos === undefined) {
+        const candidatos = SUS_ESTABELECIMENTOS_POR_TIPO.get(tipo) ?? [];
+        // Buckets are ordered by distance: keep the prefix inside the radius
+        const foraDoRaio = candidatos.findIndex(est => est.distancia_km > raio_km);
+        estabelecimentos = foraDoRaio === -1 ? candidatos : candidatos.slice(0, foraDoRaio);
+        susEstabelecimentosCache.set(cacheKey, estabelecimentos);
+      }
 
       res.json({
         success: true,
         query: { cep, tipo, raio_km },
-        estabelecimentos: estabelecimentos_mock.filter(est => 
-          tipo === "todos" || est.tipo === tipo
-        ),
-        total_encontrados: estabelecimentos_mock.length,
-        consultado_em: new Date().toISOString(),
+        estabelecimentos,
+        total_encontrados: SUS_ESTABELECIMENTOS_MOCK.length,
+        consultado_em: nowIso(),
         fonte: "SUS/CNES"
       });
     } catch (error) {
+      if (!(error instanceof z.ZodError)) return next(error);
       res.status(400).json({
         success: false,
         message: "Erro na busca de estabelecimentos SUS",
-        error: error instanceof z.ZodError ? error.errors : "Erro interno"
+        error: error.errors
       });
     }
   });
 
   app.get("/api/government/sus/raps-servicos", authenticateToken, async (req, res) => {
-    try {
-      const municipio = req.query.municipio as string || "São Paulo";
-      const tipo_servico = req.query.tipo as string || "";
-      
-      const servicos_mock = [
-        {
-          id: "raps-001",
-          nome: "CAPS III Norte",
-          tipo: "CAPS III",
-          endereco: "Rua da Saúde Mental, 100 - Santana, São Paulo",
-          telefone: "(11) 3333-7777",
-          capacidade_diaria: 60,
-          funciona_24h: true,
-          especialidades: ["Psiquiatria", "Psicologia", "Terapia Ocupacional", "Assistência Social"],
-          distancia_km: 3.2,
-          disponibilidade_leitos: 8
-        },
-        {
-          id: "raps-002", 
-          nome: "Residência Terapêutica Casa Esperança",
-          tipo: "SRT",
-          endereco: "Av. da Inclusão, 250 - Vila Mariana, São Paulo", 
-          telefone: "(11) 3333-8888",
-          capacidade_diaria: 12,
-          funciona_24h: true,
-          especialidades: ["Reabilitação Psicossocial", "Acompanhamento Terapêutico"],
-          distancia_km: 7.5,
-          vagas_disponiveis: 2
-        }
-      ];
-
-      res.json({
-        success: true,
-        municipio,
-        tipo_servico,
-        servicos: tipo_servico ? servicos_mock.filter(s => s.tipo === tipo_servico) : servicos_mock,
-        total_servicos: servicos_mock.length,
-        consultado_em: new Date().toISOString()
-      });
-    } catch (error) {
-      res.status(500).json({
-        success: false,
-        message: "Erro na consulta de serviços RAPS",
-        error: "Erro interno"
-      });
-    }
+    const municipio = req.query.municipio as string || "São Paulo";
+    const tipo_servico = req.query.tipo as string || "";
+
+    res.json({
+      success: true,
+      municipio,
+      tipo_servico,
+      servicos: tipo_servico ? SUS_RAPS_SERVICOS_POR_TIPO.get(tipo_servico) ?? [] : SUS_RAPS_SERVICOS_MOCK,
+      total_servicos: SUS_RAPS_SERVICOS_MOCK.length,
+      consultado_em: nowIso()
+    });
   });
 
-  app.post("/api/government/sus/disponibilidade-atendimento", authenticateToken, async (req, res) => {
+  app.post("/api/government/sus/disponibilidade-atendimento", authenticateToken, async (req, res, next) => {
     try {
       const { cnes, tipo_atendimento } = susAvailabilityCheckSchema.parse(req.body);
-      
-      const disponibilidade_mock = {
-        cnes,
-        estabelecimento: "CAPS AD Central",
-        tipo_atendimento,
-        disponibilidade: {
-          proximos_dias: [
-            { data: "2024-09-11", horarios_disponiveis: ["09:00", "14:00", "16:30"] },
-            { data: "2024-09-12", horarios_disponiveis: ["08:30", "10:00", "15:00"] },
-            { data: "2024-09-13", horarios_disponiveis: ["09:30", "11:00"] }
-          ],
-          tempo_espera_estimado: "5-7 dias",
-          preferencia_agendamento: "Ligar para (11) 3333-4444"
-        }
-      };
 
       res.json({
         success: true,
-        ...disponibilidade_mock,
-        consultado_em: new Date().toISOString()
+        cnes,
+        estabelecimento: SUS_DISPONIBILIDADE_MOCK.estabelecimento,
+        tipo_atendimento,
+        disponibilidade: SUS_DISPONIBILIDADE_MOCK.disponibilidade,
+        consultado_em: nowIso()
       });
     } catch (error) {
+      if (!(error instanceof z.ZodError)) return next(error);
       res.status(400).json({
         success: false,
         message: "Erro na verificação de disponibilidade",
-        error: error instanceof z.ZodError ? error.errors : "Erro interno"
+        error: error.errors
       });
     }
   });
 
   // INSS (Instituto Nacional do Seguro Social) Integration Routes
-  app.post("/api/government/inss/consultar-beneficios", authenticateToken, async (req, res) => {
+  app.post("/api/government/inss/consultar-beneficios", authenticateToken, async (req, res, next) => {
     try {
       const { cpf } = inssConsultationSchema.parse(req.body);
       
-      // Mock INSS data (sensitive data masked)
-      const beneficios_mock = {
-        cpf: cpf.substring(0, 3) + ".***.***-**",
-        nome_segurado: "SEGURADO EXEMPLO",
-        situacao_cadastral: "ativo",
-        beneficios_ativos: [
-          {
-            numero_beneficio: "123456789",
-            tipo: "auxilio_doenca",
-            codigo_especie: "B31",
-            descricao: "Auxílio-Doença Previdenciário",
-            data_inicio: "2024-01-15",
-            data_cessacao: null,
-            valor_mensal: 2500.00,
-            status: "ativo",
-            cid: "F32.9",
-            medico_perito: "Dr. José Silva - CRM 123456",
-            proxima_pericia: "2024-07-15",
-            banco_pagamento: "Banco do Brasil",
-            agencia: "1234-5",
-            conta: "12345-6"
-          }
-        ],
-        contribuicoes: {
-          tempo_contribuicao_anos: 15,
-          tempo_contribuicao_meses: 180,
-          ultima_contribuicao: "2024-01-01",
-          salario_contribuicao_atual: 4500.00,
-          media_salarios_contribuicao: 3800.00
-        }
-      };
-
       res.json({
         success: true,
-        dados_beneficiario: beneficios_mock,
-        consultado_em: new Date().toISOString(),
+        dados_beneficiario: {
+          cpf: maskCpf(cpf),
+          ...INSS_BENEFICIOS_MOCK
+        },
+        consultado_em: nowIso(),
         fonte: "INSS/DATAPREV"
       });
     } catch (error) {
+      if (!(error instanceof z.ZodError)) return next(error);
       res.status(400).json({
         success: false,
         message: "Erro na consulta de benefícios INSS",
-        error: error instanceof z.ZodError ? error.errors : "Erro interno"
+        error: error.errors
       });
     }
   });
 
-  app.post("/api/government/inss/verificar-elegibilidade", authenticateToken, async (req, res) => {
+  app.post("/api/government/inss/verificar-elegibilidade", authenticateToken, async (req, res, next) => {
     try {
       const { cpf, tempo_contribuicao_meses, salario_atual, cid } = inssEligibilitySchema.parse(req.body);
       
+      const atendeCarencia = tempo_contribuicao_meses >= CARENCIA_MINIMA_MESES;
+      const estimativaAuxilio = salario_atual * COEF_AUXILIO_DOENCA;
       const analise_elegibilidade = {
-        cpf: cpf.substring(0, 3) + ".***.***-**",
+        cpf: maskCpf(cpf),
         criterios_avaliados: {
           carencia_minima: {
-            necessario: 12,
+            necessario: CARENCIA_MINIMA_MESES,
             atual: tempo_contribuicao_meses,
-            atende: tempo_contribuicao_meses >= 12
+            atende: atendeCarencia
           },
           incapacidade_temporaria: {
             cid_informado: cid || "Não informado",
@@ -604,148 +711,127 @@ export async function registerRoutes(app: Express): Promise<Express> {
           },
           salario_beneficio: {
             salario_atual,
-            valor_estimado_auxilio: Math.min(salario_atual * 0.91, 7507.49)
+            valor_estimado_auxilio: estimativaAuxilio > TETO_INSS ? TETO_INSS : estimativaAuxilio
           }
         },
-        recomendacao: tempo_contribuicao_meses >= 12 
-          ? "Elegível para auxílio-doença. Procure perícia médica."
-          : "Necessário completar carência mínima de 12 contribuições."
+        recomendacao: atendeCarencia
+          ? RECOMENDACAO_ELEGIVEL
+          : RECOMENDACAO_CARENCIA
       };
 
       res.json({
         success: true,
         analise_elegibilidade,
-        consultado_em: new Date().toISOString()
+        consultado_em: nowIso()
       });
     } catch (error) {
+      if (!(error instanceof z.ZodError)) return next(error);
       res.status(400).json({
         success: false,
         message: "Erro na verificação de elegibilidade",
-        error: error instanceof z.ZodError ? error.errors : "Erro interno"
+        error: error.errors
       });
     }
   });
 
   // SIAFI (Sistema Integrado de Administração Financeira) Integration Routes
-  app.post("/api/government/siafi/consultar-gastos-saude-mental", authenticateToken, async (req, res) => {
+  app.post("/api/government/siafi/consultar-gastos-saude-mental", authenticateToken, async (req, res, next) => {
     try {
       const { ente_federativo, ano } = siafiExpenseSearchSchema.parse(req.body);
       
-      const gastos_mock = {
-        ente_federativo,
-        ano_referencia: ano,
-        resumo_execucao: {
-          dotacao_inicial: 150000000.00,
-          dotacao_atualizada: 165000000.00,
-          valor_empenhado: 142000000.00,
-          valor_liquidado: 138000000.00,
-          valor_pago: 135000000.00,
-          percentual_execucao: 86.1
-        },
-        programas_saude_mental: [
-          {
-            codigo_programa: "2015",
-            nome_programa: "Fortalecimento do Sistema Único de Saúde",
-            acao: "Atenção à Saúde da População para Procedimentos de Média e Alta Complexidade",
-            valor_empenhado: 85000000.00,
-            valor_pago: 80000000.00
-          },
-          {
-            codigo_programa: "2015",
-            nome_programa: "Fortalecimento do Sistema Único de Saúde",
-            acao: "Atenção Básica em Saúde", 
-            valor_empenhado: 35000000.00,
-            valor_pago: 33500000.00
-          }
-        ],
-        investimentos_caps: {
-          construcao_novos_caps: {
-            valor_empenhado: 12000000.00,
-            unidades_previstas: 8,
-            unidades_entregues: 5
-          },
-          reforma_caps_existentes: {
-            valor_empenhado: 5000000.00,
-            unidades_reformadas: 15
-          }
-        }
-      };
+      const cacheKey = JSON.stringify([ente_federativo, ano]);
+      let dados_transparencia = siafiGastosCache.get(cacheKey);
+      if (!dados_transparencia) {
+        dados_transparencia = {
+          ente_federativo,
+          ano_referencia: ano,
+          ...SIAFI_GASTOS_MOCK
+        };
+        siafiGastosCache.set(cacheKey, dados_transparencia);
+      }
 
       res.json({
         success: true,
-        dados_transparencia: gastos_mock,
-        consultado_em: new Date().toISOString(),
+        dados_transparencia,
+        consultado_em: nowIso(),
         fonte: "SIAFI/Portal da Transparência"
       });
     } catch (error) {
+      if (!(error instanceof z.ZodError)) return next(error);
       res.status(400).json({
         success: false,
         message: "Erro na consulta de gastos públicos",
-        error: error instanceof z.ZodError ? error.errors : "Erro interno"
+        error: error.errors
       });
     }
   });
 
   // RAPS (Rede de Atenção Psicossocial) Integration Routes
-  app.post("/api/government/raps/buscar-servicos", authenticateToken, async (req, res) => {
+  app.post("/api/government/raps/buscar-servicos", authenticateToken, async (req, res, next) => {
     try {
       const { municipio, tipo_servico, urgencia } = rapsServiceSearchSchema.parse(req.body);
       
-      const servicos_raps = [
-        {
-          id: "raps-caps-01",
-          nome: "CAPS II Centro",
-          tipo: "CAPS II",
-          endereco: {
-            logradouro: "Rua da Mente Sã, 456",
-            bairro: "Centro",
-            municipio,
-            cep: "01000-000"
-          },
-          telefone: "(11) 1111-2222",
-          especialidades: ["Psiquiatria", "Psicologia", "Terapia Ocupacional"],
-          horario_funcionamento: "Segunda a Sexta: 8h-18h",
-          aceita_urgencia: urgencia,
-          tempo_espera_dias: urgencia ? 0 : 15,
-          disponibilidade_imediata: urgencia
-        },
-        {
-          id: "raps-upa-01", 
-          nome: "UPA 24h São João",
-          tipo: "UPA",
-          endereco: {
-            logradouro: "Av. Emergência, 789",
-            bairro: "São João",
-            municipio,
-            cep: "01000-001"
+      const cacheKey = JSON.stringify([municipio, tipo_servico ?? null, urgencia]);
+      let servicos_filtrados = rapsServicosCache.get(cacheKey);
+      if (!servicos_filtrados) {
+        const servicos_raps = [
+          {
+            id: "raps-caps-01",
+            nome: "CAPS II Centro",
+            tipo: "CAPS II",
+            endereco: {
+              logradouro: "Rua da Mente Sã, 456",
+              bairro: "Centro",
+              municipio,
+              cep: "01000-000"
+            },
+            telefone: "(11) 1111-2222",
+            especialidades: ["Psiquiatria", "Psicologia", "Terapia Ocupacional"],
+            horario_funcionamento: "Segunda a Sexta: 8h-18h",
+            aceita_urgencia: urgencia,
+            tempo_espera_dias: urgencia ? 0 : 15,
+            disponibilidade_imediata: urgencia
           },
-          telefone: "(11) 2222-3333",
-          especialidades: ["Psiquiatria de Emergência", "Clínica Médica"],
-          horario_funcionamento: "24 horas",
-          aceita_urgencia: true,
-          tempo_espera_dias: 0,
-          disponibilidade_imediata: true
-        }
-      ];
-
-      const servicos_filtrados = servicos_raps.filter(servico => {
-        if (tipo_servico && servico.tipo !== tipo_servico) return false;
-        if (urgencia && !servico.aceita_urgencia) return false;
-        return true;
-      });
+          {
+            id: "raps-upa-01", 
+            nome: "UPA 24h São João",
+            tipo: "UPA",
+            endereco: {
+              logradouro: "Av. Emergência, 789",
+              bairro: "São João",
+              municipio,
+              cep: "01000-001"
+            },
+            telefone: "(11) 2222-3333",
+            especialidades: ["Psiquiatria de Emergência", "Clínica Médica"],
+            horario_funcionamento: "24 horas",
+            aceita_urgencia: true,
+            tempo_espera_dias: 0,
+            disponibilidade_imediata: true
+          }
+        ];
+
+        servicos_filtrados = servicos_raps.filter(servico => {
+          if (tipo_servico && servico.tipo !== tipo_servico) return false;
+          if (urgencia && !servico.aceita_urgencia) return false;
+          return true;
+        });
+        rapsServicosCache.set(cacheKey, servicos_filtrados);
+      }
 
       res.json({
         success: true,
         criterios_busca: { municipio, tipo_servico, urgencia },
         servicos_encontrados: servicos_filtrados,
         total_servicos: servicos_filtrados.length,
-        consultado_em: new Date().toISOString()
+        consultado_em: nowIso()
       });
     } catch (error) {
+      if (!(error instanceof z.ZodError)) return next(error);
       res.status(400).json({
         success: false,
         message: "Erro na busca de serviços RAPS",
-        error: error instanceof z.ZodError ? error.errors : "Erro interno"
+        error: error.errors
       });
     }
   });
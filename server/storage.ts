@@ -100,7 +100,7 @@ export class DatabaseStorage implements IStorage {
   async updateUser(id: string, updateUser: Partial<InsertUser>): Promise<User> {
     const [user] = await db
       .update(users)
-      .set({ ...updateUser, updatedAt: new Date() })
+      .set(updateUser)
       .where(eq(users.id, id))
       .returning();
     return user;
@@ -126,7 +126,7 @@ export class DatabaseStorage implements IStorage {
   async updateCompany(id: string, updateCompany: Partial<InsertCompany>): Promise<Company> {
     const [company] = await db
       .update(companies)
-      .set({ ...updateCompany, updatedAt: new Date() })
+      .set(updateCompany)
       .where(eq(companies.id, id))
       .returning();
     return company;
@@ -234,7 +234,7 @@ export class DatabaseStorage implements IStorage {
   async updateActionPlan(id: string, plan: Partial<InsertActionPlan>): Promise<ActionPlan> {
     const [actionPlan] = await db
       .update(actionPlans)
-      .set({ ...plan, updatedAt: new Date() })
+      .set(plan)
       .where(eq(actionPlans.id, id))
       .returning();
     return actionPlan;
@@ -259,7 +259,7 @@ export class DatabaseStorage implements IStorage {
   async markNotificationAsRead(id: string): Promise<Notification> {
     const [notification] = await db
       .update(notifications)
-      .set({ isRead: true, readDate: new Date() })
+      .set({ isRead: true, readDate: sql`now()` })
       .where(eq(notifications.id, id))
       .returning();
     return notification;
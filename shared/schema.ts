@@ -1,5 +1,5 @@
 import { sql, relations } from "drizzle-orm";
-import { pgTable, text, varchar, integer, decimal, boolean, timestamp, date, jsonb, uuid, inet } from "drizzle-orm/pg-core";
+import { pgTable, index, text, varchar, integer, decimal, boolean, timestamp, date, jsonb, uuid, inet } from "drizzle-orm/pg-core";
 import { createInsertSchema } from "drizzle-zod";
 import { z } from "zod";
 
@@ -18,7 +18,7 @@ export const companies = pgTable("companies", {
   activeModules: jsonb("active_modules").default(sql`'[]'`),
   status: varchar("status", { length: 20 }).default("active"),
   createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
+  updatedAt: timestamp("updated_at").defaultNow().$onUpdate(() => sql`now()`),
 });
 
 // Users table (employees)
@@ -39,7 +39,7 @@ export const users = pgTable("users", {
   lgpdConsent: boolean("lgpd_consent").default(false),
   consentDate: timestamp("consent_date"),
   createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
+  updatedAt: timestamp("updated_at").defaultNow().$onUpdate(() => sql`now()`),
 });
 
 // DISC Assessments
@@ -60,7 +60,10 @@ export const discAssessments = pgTable("disc_assessments", {
   recommendations: jsonb("recommendations"),
   assessmentDate: timestamp("assessment_date").defaultNow(),
   validUntil: date("valid_until"),
-});
+}, (table) => [
+  index("ix_disc_assessments_user_date").on(table.userId, table.assessmentDate),
+  index("ix_disc_assessments_company_date").on(table.companyId, table.assessmentDate),
+]);
 
 // Mental Health Assessments
 export const mentalHealthAssessments = pgTable("mental_health_assessments", {
@@ -76,7 +79,10 @@ export const mentalHealthAssessments = pgTable("mental_health_assessments", {
   requiresIntervention: boolean("requires_intervention").default(false),
   assessmentDate: timestamp("assessment_date").defaultNow(),
   evaluatorId: uuid("evaluator_id").references(() => users.id),
-});
+}, (table) => [
+  index("ix_mental_health_assessments_user_date").on(table.userId, table.assessmentDate),
+  index("ix_mental_health_assessments_company_date").on(table.companyId, table.assessmentDate),
+]);
 
 // Psychosocial Risks (NR-1 compliance)
 export const psychosocialRisks = pgTable("psychosocial_risks", {
@@ -93,7 +99,10 @@ export const psychosocialRisks = pgTable("psychosocial_risks", {
   status: varchar("status", { length: 20 }).default("identified"),
   identificationDate: timestamp("identification_date").defaultNow(),
   resolutionDate: timestamp("resolution_date"),
-});
+}, (table) => [
+  index("ix_psychosocial_risks_company_identified").on(table.companyId, table.identificationDate),
+  index("ix_psychosocial_risks_company_level").on(table.companyId, table.riskLevel),
+]);
 
 // RAPS Services
 export const rapsServices = pgTable("raps_services", {
@@ -211,8 +220,10 @@ export const actionPlans = pgTable("action_plans", {
   progress: integer("progress").default(0),
   results: jsonb("results"),
   createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
-});
+  updatedAt: timestamp("updated_at").defaultNow().$onUpdate(() => sql`now()`),
+}, (table) => [
+  index("ix_action_plans_company_created").on(table.companyId, table.createdAt),
+]);
 
 // Reports
 export const reports = pgTable("reports", {
@@ -240,7 +251,9 @@ export const notifications = pgTable("notifications", {
   isRead: boolean("is_read").default(false),
   sentDate: timestamp("sent_date").defaultNow(),
   readDate: timestamp("read_date"),
-});
+}, (table) => [
+  index("ix_notifications_user_sent").on(table.userId, table.sentDate),
+]);
 
 // Relations
 export const companiesRelations = relations(companies, ({ many }) => ({